@@ -1,14 +1,11 @@
 import argparse
 import logging
+import sys
 
 from datetime import datetime, timedelta
 
 from riddlesolver import __version__
-from riddlesolver.config import load_config_from_file, save_config_to_file, get_config_value, set_config_value, grant_github_auth
 from riddlesolver.constants import DEFAULT_SETTINGS
-from riddlesolver.repository import fetch_commits
-from riddlesolver.summary import generate_commit_summary
-from riddlesolver.utils import parse_date, handle_error, validate_arguments, get_repository_type
 
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -16,14 +13,35 @@ logger = logging.getLogger(__name__)
 
 
 def main():
-    config = load_config_from_file()
+    # answer version queries straight from argv before paying for argparse
+    # construction; '--command=version' still falls through to the parsed check
+    if sniff_version(sys.argv[1:]):
+        logger.info(f"Riddlesolver version {get_version()}")
+        return
+
     args = parse_arguments()
 
+    if args.quiet:
+        # suppress progress chatter; disabled log calls skip formatting
+        # entirely thanks to lazy %-style arguments
+        logging.getLogger().setLevel(logging.WARNING)
+
+    if args.command == "version" or args.version:
+        logger.info(f"Riddlesolver version {get_version()}")
+        return
+
+    # Heavy dependencies (GitPython, OpenAI, requests) are imported lazily so
+    # that --help and the version command don't pay their import cost.
+    from riddlesolver.config import load_config_from_file, get_access_token, set_config_value, grant_github_auth
+
+    config = load_config_from_file()
+
     if args.command == "config":
         if len(args.config_args) == 3:
             section, key, value = args.config_args
+            # set_config_value persists the change; saving the config loaded
+            # above would write back a copy that predates it
             set_config_value(section, key, value)
-            save_config_to_file(config)
             logger.info(f"Configuration updated: [{section}] {key} = {value}")
         else:
             logger.error("Invalid number of arguments for 'config' command.")
@@ -32,18 +50,17 @@ def main():
 
     if args.command == "grant-auth":
         grant_github_auth()
-        save_config_to_file(config)
         logger.info("GitHub authentication granted.")
         return
 
-    if args.command == "version" or args.version:
-        logger.info(f"Riddlesolver version {get_version()}")
-        return
-
     if not args.repo:
         logger.error("Please provide a repository path or URL.")
         return
 
+    from riddlesolver.repository import fetch_commits
+    from riddlesolver.summary import generate_commit_summary
+    from riddlesolver.utils import handle_error, validate_arguments, get_repository_type
+
     repo_path = args.repo
     start_date, end_date = get_date_range(args)
     branch = args.branch
@@ -53,18 +70,39 @@ def main():
     try:
         validate_arguments(repo_path, start_date, end_date)
         repo_type = get_repository_type(repo_path)
-        access_token = get_config_value(repo_type, "access_token")
+        access_token = get_access_token(repo_type)
         batched_commits = fetch_commits(repo_path, start_date, end_date, branch, author, access_token, repo_type)
         branch = f" on branch '{branch}'" if branch else ""
         author = f" by '{author}'" if author else ""
         start_date = start_date.strftime("%Y-%m-%d")
         end_date = end_date.strftime("%Y-%m-%d")
         logger.info(f"Start generating commits summary ({start_date} to {end_date}){branch}{author}:")
-        generate_commit_summary(batched_commits, config, output_file)
+        generate_commit_summary(batched_commits, config, output_file, batch_mode=args.batch,
+                                no_cache=args.no_cache)
     except Exception as e:
         handle_error(e)
 
 
+def sniff_version(argv):
+    """
+    Detects a version request from raw argv so the fast-path can answer
+    without building the argument parser.
+
+    Args:
+        argv (list): The command-line arguments, without the program name.
+
+    Returns:
+        bool: True when the invocation only asks for the version.
+    """
+    if "-v" in argv or "--version" in argv:
+        return True
+    for flag in ("-c", "--command"):
+        if flag in argv:
+            index = argv.index(flag)
+            return index + 1 < len(argv) and argv[index + 1] == "version"
+    return False
+
+
 def parse_arguments():
     parser = argparse.ArgumentParser(description="Commit Summary Generator")
     parser.add_argument("repo", nargs="?", help="Repository path or URL")
@@ -76,6 +114,12 @@ def parse_arguments():
     parser.add_argument("-b", "--branch", help="Branch name")
     parser.add_argument("-a", "--author", help="Author name or email")
     parser.add_argument("-o", "--output", help="Output file path")
+    parser.add_argument("--batch", action="store_true",
+                        help="Submit summaries through OpenAI's discounted batch API (results within 24h)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk summary cache and always query OpenAI")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="Only print the summary and warnings, no progress logs")
     parser.add_argument("-c", "--command", choices=["config", "grant-auth", "version"], help="Command to execute")
     parser.add_argument("config_args", nargs="*", help="Arguments for the 'config' command")
     parser.add_argument("-v", "--version", action="store_true", help="Show version information")
@@ -83,20 +127,23 @@ def parse_arguments():
 
 
 def get_date_range(args):
+    now = datetime.now()
     if args.days:
-        end_date = datetime.now()
+        end_date = now
         start_date = end_date - timedelta(days=args.days)
     elif args.weeks:
-        end_date = datetime.now()
+        end_date = now
         start_date = end_date - timedelta(weeks=args.weeks)
     elif args.months:
-        end_date = datetime.now()
+        end_date = now
         start_date = end_date - timedelta(days=args.months * 30)  # Approximate month as 30 days
     elif args.start_date and args.end_date:
+        from riddlesolver.utils import parse_date
+
         start_date = parse_date(args.start_date)
         end_date = parse_date(args.end_date)
     else:
-        end_date = datetime.now()
+        end_date = now
         start_date = end_date - timedelta(days=DEFAULT_SETTINGS["default_date_range"])
     return start_date, end_date
 
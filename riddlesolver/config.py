@@ -1,10 +1,11 @@
-import configparser
+import functools
 import logging
+import os
+import tempfile
 import time
 from pathlib import Path
 
-import pyperclip
-import requests
+from riddlesolver.fast_config import FastConfigParser, load_config
 
 # .riddlesolver in the user's home directory
 CONFIG_FILE = Path.joinpath(Path.home(), ".riddlesolver")
@@ -16,7 +17,12 @@ DEFAULT_CONFIG = {
     },
     "general": {
         "cache_dir": "",
-        "cache_duration": "7"
+        "cache_duration": "7",
+        "fetch_ttl_seconds": "300"
+    },
+    "cache": {
+        "enabled": "true",
+        "ttl_days": "30"
     },
     "github": {
         "access_token": ""
@@ -26,30 +32,26 @@ DEFAULT_CONFIG = {
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Device-flow polling: each pending poll waits a little longer than the last,
+# up to a cap, and gives up after a bounded number of attempts
+POLL_BACKOFF_BASE = 1.3
+POLL_MAX_DELAY = 60
+POLL_MAX_ATTEMPTS = 60
 
-def get_config():
-    """
-    Retrieves the configuration from the config file.
 
-    Returns:
-        configparser.ConfigParser: The loaded configuration.
+def write_config_file(config):
     """
-    config = configparser.ConfigParser()
-    config.read(CONFIG_FILE)
-    logger.info("Configuration loaded from file.")
-    return config
-
-
-def set_config(config):
-    """
-    Saves the configuration to the config file.
+    Writes the configuration to the config file atomically: the content goes
+    to a temporary file in the same directory which then replaces the config
+    file in one rename, so a crash mid-write never leaves a truncated file.
 
     Args:
-        config (configparser.ConfigParser): The configuration to save.
+        config (FastConfigParser): The configuration to save.
     """
-    with open(CONFIG_FILE, "w") as config_file:
+    fd, tmp_path = tempfile.mkstemp(dir=CONFIG_FILE.parent, prefix=".riddlesolver.")
+    with os.fdopen(fd, "w") as config_file:
         config.write(config_file)
-    logger.info("Configuration saved to file.")
+    os.replace(tmp_path, CONFIG_FILE)
 
 
 def load_config_from_file():
@@ -57,15 +59,14 @@ def load_config_from_file():
     Loads the configuration from the config file. If the file doesn't exist, creates a new config file with default values.
 
     Returns:
-        configparser.ConfigParser: The loaded configuration.
+        FastConfigParser: The loaded configuration.
     """
-    config = configparser.ConfigParser()
     if not Path(CONFIG_FILE).exists():
-        config.read_dict(DEFAULT_CONFIG)
+        config = _default_config().copy()
         save_config_to_file(config)
         logger.info("Default configuration created and saved to file.")
     else:
-        config.read(CONFIG_FILE)
+        config = load_config(CONFIG_FILE)
         logger.info("Configuration loaded from file.")
     return config
 
@@ -75,29 +76,45 @@ def save_config_to_file(config):
     Saves the configuration to the config file.
 
     Args:
-        config (configparser.ConfigParser): The configuration to save.
+        config (FastConfigParser): The configuration to save.
     """
-    with open(CONFIG_FILE, "w") as config_file:
-        config.write(config_file)
+    write_config_file(config)
+    # the file on disk changed; cached reads must not outlive it
+    get_config_value.cache_clear()
     logger.info("Configuration saved to file.")
 
 
 def get_default_config():
     """
-    Returns the default configuration.
+    Returns the default configuration. The parser is built once per process
+    and copied on return, so callers can mutate their copy freely.
 
     Returns:
-        configparser.ConfigParser: The default configuration.
+        FastConfigParser: The default configuration.
     """
-    config = configparser.ConfigParser()
-    config.read_dict(DEFAULT_CONFIG)
+    config = _default_config().copy()
     logger.info("Default configuration loaded.")
     return config
 
 
+@functools.lru_cache(maxsize=None)
+def _default_config():
+    """
+    Builds the shared default configuration parser exactly once.
+
+    Returns:
+        FastConfigParser: The default configuration, treated as read-only.
+    """
+    config = FastConfigParser()
+    config.read_dict(DEFAULT_CONFIG)
+    return config
+
+
+@functools.lru_cache(maxsize=None)
 def get_config_value(section, key):
     """
-    Retrieves the value of a specific configuration option.
+    Retrieves the value of a specific configuration option, cached for the
+    process lifetime; writes through set_config_value drop the cache.
 
     Args:
         section (str): The section of the configuration option.
@@ -108,13 +125,29 @@ def get_config_value(section, key):
     """
     config = load_config_from_file()
     value = config.get(section, key, fallback=None)
-    logger.info(f"Retrieved configuration value: [{section}] {key} = {value}")
+    logger.info("Retrieved configuration value: [%s] %s = %s", section, key, value)
     return value
 
 
+@functools.lru_cache(maxsize=None)
+def get_access_token(section):
+    """
+    Retrieves the access token for a repository type, cached for the process
+    lifetime so repeated lookups skip the config read entirely.
+
+    Args:
+        section (str): The section holding the token, e.g. "github".
+
+    Returns:
+        str: The access token, or None when not configured.
+    """
+    return get_config_value(section, "access_token")
+
+
 def set_config_value(section, key, value):
     """
-    Sets the value of a specific configuration option.
+    Sets the value of a specific configuration option and persists it to the
+    config file.
 
     Args:
         section (str): The section of the configuration option.
@@ -125,6 +158,11 @@ def set_config_value(section, key, value):
     if section not in config:
         config.add_section(section)
     config.set(section, key, value)
+    # load_config_from_file returns an independent copy, so the change only
+    # exists here until it is written back
+    save_config_to_file(config)
+    if key == "access_token":
+        get_access_token.cache_clear()
     logger.info(f"Configuration value set: [{section}] {key} = {value}")
 
 
@@ -132,7 +170,9 @@ def grant_github_auth():
     """
     Grants GitHub access to the application by setting the GitHub access token in the configuration.
     """
-    config = load_config_from_file()
+    # imported lazily so only the auth flow pays for pyperclip
+    import pyperclip
+
     code_response = request_device_code()
 
     verification_uri = code_response.get("verification_uri")
@@ -147,8 +187,8 @@ def grant_github_auth():
 
     access_token = poll_for_token(device_code, interval)
     if access_token:
+        # set_config_value persists the token itself
         set_config_value(section="github", key="access_token", value=access_token)
-        save_config_to_file(config)
         logger.info("GitHub authentication successful.")
     else:
         logger.error("GitHub authentication failed.")
@@ -161,17 +201,24 @@ def request_device_code():
     Returns:
         dict: The device code response.
     """
+    # imported lazily to keep CLI startup fast; the shared session reuses
+    # one TLS connection across the device-code request and the token polls
+    from riddlesolver.utils import get_github_session
+
     url = f'https://github.com/login/device/code'
     parameters = {'client_id': 'Iv1.6ca45792fc03e432'}
     headers = {'Accept': 'application/json'}
 
-    response = requests.post(url, data=parameters, headers=headers)
+    response = get_github_session().post(url, data=parameters, headers=headers)
     response.raise_for_status()
     logger.info("Device code requested from GitHub.")
     return response.json()
 
 
 def request_token(device_code):
+    # imported lazily to keep CLI startup fast
+    from riddlesolver.utils import get_github_session
+
     uri = f"https://github.com/login/oauth/access_token"
     parameters = {
         "client_id": "Iv1.6ca45792fc03e432",
@@ -181,7 +228,7 @@ def request_token(device_code):
 
     headers = {"Accept": "application/json"}
 
-    response = requests.post(uri, data=parameters, headers=headers)
+    response = get_github_session().post(uri, data=parameters, headers=headers)
     response.raise_for_status()
     logger.info("Access token requested from GitHub.")
     return response.json()
@@ -193,21 +240,26 @@ def poll_for_token(device_code, interval):
 
     Args:
         device_code (str): The device code.
-        interval (int): The polling interval in seconds.
+        interval (int): The initial polling interval in seconds.
     """
-    while True:
+    delay = interval
+    for _ in range(POLL_MAX_ATTEMPTS):
         response = request_token(device_code)
         error = response.get("error")
         access_token = response.get("access_token")
 
         if error:
             if error == "authorization_pending":
-                time.sleep(interval)
                 logger.info("Authorization pending. Waiting before polling again.")
+                time.sleep(delay)
+                # back off gradually instead of polling at a constant rate
+                delay = min(POLL_MAX_DELAY, delay * POLL_BACKOFF_BASE)
                 continue
             elif error == "slow_down":
-                time.sleep(interval + 5)
+                # GitHub asked for a slower pace; back off twice as hard
+                delay = min(POLL_MAX_DELAY, delay * POLL_BACKOFF_BASE * POLL_BACKOFF_BASE)
                 logger.warning("Polling too fast. Waiting for an extended interval before polling again.")
+                time.sleep(delay)
                 continue
             elif error == "expired_token":
                 logger.error("The device code has expired. Please run `login` again.")
@@ -220,4 +272,7 @@ def poll_for_token(device_code, interval):
                 return None
         else:
             logger.info("Access token obtained from GitHub.")
-            return access_token
\ No newline at end of file
+            return access_token
+
+    logger.error("GitHub authorization timed out. Please run `login` again.")
+    return None
\ No newline at end of file
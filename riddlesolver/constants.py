@@ -9,12 +9,13 @@ DEFAULT_SETTINGS = {
 
 DATE_FORMAT = "%Y-%m-%d"  # Format for parsing and displaying dates
 
-SUMMARY_PROMPT_TEMPLATE = """
-You are a helpful assistant that summarizes Git commit messages for the branch "{branch_name}" in a clear, concise, and standardized manner.
+# Static instructions sent as the system message. Kept free of interpolation
+# so the byte-identical prefix is eligible for OpenAI's server-side prompt
+# caching across calls.
+SUMMARY_SYSTEM_PROMPT = """
+You are a helpful assistant that summarizes Git commit messages for a branch in a clear, concise, and standardized manner.
 
-Please provide a summary of the following Git commit messages:
-
-{commit_messages}
+The user message provides the branch name and the Git commit messages to summarize.
 
 Strictly obey the output format the summary as follows:
 - 📝 Summary:
@@ -0,0 +1,185 @@
+import re
+from pathlib import Path
+
+# Matches "[section]" headers and "key = value" lines; comments and blank
+# lines simply fail to match and are skipped.
+SECTION_RE = re.compile(r'^\s*\[([^\]]+)\]')
+KV_RE = re.compile(r'^\s*([^=;#\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+BOOLEAN_STATES = {
+    "1": True, "yes": True, "true": True, "on": True,
+    "0": False, "no": False, "false": False, "off": False,
+}
+
+# Parsed configs keyed by path, with the file mtime used for invalidation
+_cache = {}
+
+# Shared empty mapping so lookups of missing sections allocate nothing
+_EMPTY = {}
+
+
+class FastConfigParser:
+    """
+    A minimal regex-based INI parser covering the subset of
+    configparser.ConfigParser that riddlesolver uses. It skips configparser's
+    line-by-line state machine and interpolation, which dominate the cost of
+    reading the tiny config file on every CLI invocation.
+    """
+
+    def __init__(self):
+        self._sections = {}
+
+    def __contains__(self, section):
+        return section in self._sections
+
+    def sections(self):
+        """
+        Returns the list of section names.
+
+        Returns:
+            list: The section names.
+        """
+        return list(self._sections)
+
+    def add_section(self, section):
+        """
+        Adds a section if it doesn't exist yet.
+
+        Args:
+            section (str): The section name.
+        """
+        self._sections.setdefault(section, {})
+
+    def read(self, path):
+        """
+        Reads and parses a config file. Missing files are silently ignored,
+        matching configparser behaviour.
+
+        Args:
+            path (str | Path): The path to the config file.
+        """
+        path = Path(path)
+        if path.exists():
+            self.read_string(path.read_text())
+
+    def read_string(self, text):
+        """
+        Parses configuration from a string.
+
+        Args:
+            text (str): The INI-formatted configuration text.
+        """
+        section = None
+        for line in text.splitlines():
+            match = SECTION_RE.match(line)
+            if match:
+                section = self._sections.setdefault(match.group(1), {})
+                continue
+            match = KV_RE.match(line)
+            if match and section is not None:
+                section[match.group(1)] = match.group(2)
+
+    def read_dict(self, dictionary):
+        """
+        Loads configuration from a dictionary of sections.
+
+        Args:
+            dictionary (dict): A mapping of section names to key/value dicts.
+        """
+        for section, values in dictionary.items():
+            self._sections.setdefault(section, {}).update(values)
+
+    def get(self, section, key, fallback=None):
+        """
+        Retrieves a configuration value.
+
+        Args:
+            section (str): The section of the configuration option.
+            key (str): The key of the configuration option.
+            fallback (str): The value returned when the option is missing.
+
+        Returns:
+            str: The value of the configuration option.
+        """
+        return self._sections.get(section, _EMPTY).get(key, fallback)
+
+    def getint(self, section, key, fallback=None):
+        """
+        Retrieves a configuration value as an integer.
+        """
+        value = self.get(section, key)
+        return int(value) if value is not None else fallback
+
+    def getboolean(self, section, key, fallback=None):
+        """
+        Retrieves a configuration value as a boolean.
+        """
+        value = self.get(section, key)
+        if value is None:
+            return fallback
+        return BOOLEAN_STATES[value.lower()]
+
+    def copy(self):
+        """
+        Returns an independent copy of the configuration.
+
+        Returns:
+            FastConfigParser: The copied configuration.
+        """
+        duplicate = FastConfigParser()
+        duplicate._sections = {section: dict(values) for section, values in self._sections.items()}
+        return duplicate
+
+    def set(self, section, key, value):
+        """
+        Sets a configuration value, creating the section if needed.
+
+        Args:
+            section (str): The section of the configuration option.
+            key (str): The key of the configuration option.
+            value (str): The value to set.
+        """
+        self._sections.setdefault(section, {})[key] = value
+
+    def write(self, file):
+        """
+        Writes the configuration in INI format.
+
+        Args:
+            file: A writable text file object.
+        """
+        for section, values in self._sections.items():
+            file.write(f"[{section}]\n")
+            for key, value in values.items():
+                file.write(f"{key} = {value}\n")
+            file.write("\n")
+
+
+def load_config(path):
+    """
+    Parses the config file at the given path, reusing the cached result while
+    the file is unchanged on disk. Every call returns an independent copy, so
+    a caller mutating its config never alters what later callers load.
+
+    Args:
+        path (str | Path): The path to the config file.
+
+    Returns:
+        FastConfigParser: The parsed configuration.
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return FastConfigParser()
+
+    # nanosecond mtime plus size, so same-second rewrites still invalidate
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(str(path))
+    if cached and cached[0] == key:
+        return cached[1].copy()
+
+    config = FastConfigParser()
+    config.read(path)
+    _cache[str(path)] = (key, config)
+    return config.copy()
@@ -1,20 +1,48 @@
 import os
-import shutil
+import sys
+import tempfile
+import threading
+import time
 import logging
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from datetime import datetime, timedelta
 
-from dateutil.parser import parse
-from git import Repo, InvalidGitRepositoryError
-
 from riddlesolver.config import get_config_value
 from riddlesolver.utils import (
     extract_owner_repo, get_base_branch_map, get_all_unique_commits,
-    get_base_branch_map_local, get_all_unique_commits_local, get_all_commits
+    get_base_branch_map_local, get_all_unique_commits_local, get_all_commits,
+    get_all_commits_graphql
 )
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Lightweight stand-in for git.Commit carrying only the fields the summary
+# pipeline reads, so commits can be parsed straight from rev-list output.
+# committed_date is the raw epoch timestamp, like git.Commit.committed_date.
+CommitRecord = namedtuple("CommitRecord", ["hexsha", "committed_date", "author", "message"])
+
+
+def parse_commit_date(date_string):
+    """
+    Parses the RFC 3339 timestamps the GitHub API returns. fromisoformat is
+    an order of magnitude faster than dateutil for this fixed format, so
+    dateutil is only imported and used when the fast path fails.
+
+    Args:
+        date_string (str): The timestamp, e.g. "2024-05-01T12:30:00Z".
+
+    Returns:
+        datetime: The parsed datetime.
+    """
+    try:
+        return datetime.fromisoformat(date_string.replace("Z", "+00:00"))
+    except ValueError:
+        from dateutil.parser import parse
+        return parse(date_string)
+
 
 def fetch_commits(repo_path, start_date, end_date, branch=None, author=None, access_token=None, repo_type=None,
                   config=None, cache_dir=None):
@@ -53,6 +81,57 @@ def fetch_commits(repo_path, start_date, end_date, branch=None, author=None, acc
         return fetch_commits_from_remote(repo_path, start_date, end_date, branch, author, config)
 
 
+# One lock per repository path, so batch workers targeting the same cached
+# clone serialize against each other without blocking unrelated repos
+_repo_locks = defaultdict(threading.Lock)
+_repo_locks_guard = threading.Lock()
+
+
+def repo_lock(repo_path):
+    """
+    Returns the lock guarding concurrent access to a repository path.
+
+    Args:
+        repo_path (str): The repository path or URL.
+
+    Returns:
+        threading.Lock: The per-repository lock.
+    """
+    with _repo_locks_guard:
+        return _repo_locks[repo_path]
+
+
+def fetch_commits_batch(specs, config=None, max_workers=None):
+    """
+    Fetches commits for several repositories in parallel. Clones and fetches
+    are network-bound, so fanning the repositories out across threads brings
+    the wall clock close to the slowest repository instead of the sum.
+
+    Args:
+        specs (list): Keyword-argument dicts, one per fetch_commits call.
+        config (FastConfigParser): The configuration; its [general]
+            fetch_parallel value caps the pool when max_workers is not given.
+        max_workers (int): The maximum number of parallel fetches.
+
+    Returns:
+        list: The fetch_commits result for each spec, in spec order.
+    """
+    if max_workers is None:
+        if config:
+            value = config.get("general", "fetch_parallel", fallback=None)
+        else:
+            value = get_config_value("general", "fetch_parallel")
+        max_workers = int(value) if value else 8
+
+    def fetch_one(spec):
+        with repo_lock(spec["repo_path"]):
+            return fetch_commits(**spec)
+
+    with ThreadPoolExecutor(max_workers=min(len(specs), max_workers) or 1) as executor:
+        futures = [executor.submit(fetch_one, spec) for spec in specs]
+        return [future.result() for future in futures]
+
+
 def fetch_commits_from_github(repo_path, start_date, end_date, branch=None, author=None, access_token=None,
                               unique_commits=False):
     """
@@ -73,6 +152,11 @@ def fetch_commits_from_github(repo_path, start_date, end_date, branch=None, auth
 
     results = []
 
+    if start_date >= end_date:
+        # empty window; don't spend any round trips on it
+        logger.warning("The requested date range is empty, skipping commit fetch.")
+        return results
+
     logger.info(f'Collecting unique commits from {repo_path}...')
 
     if unique_commits:
@@ -82,53 +166,53 @@ def fetch_commits_from_github(repo_path, start_date, end_date, branch=None, auth
                                          start_date=start_date, end_date=end_date, access_token=access_token,
                                          author=author)
     else:
-        commits = get_all_commits(repo_path=repo_path, start_date=start_date, end_date=end_date,
-                                  access_token=access_token,
-                                  author=author)
-
-    for unique_commit_pair in commits.items():
-        branch_name = unique_commit_pair[0]
-        commits = unique_commit_pair[1]
-
+        commits = None
+        if access_token and not branch and not author:
+            # one GraphQL POST replaces the per-branch REST loop; the author
+            # filter stays on REST because GraphQL only matches exact emails
+            commits = get_all_commits_graphql(repo_path=repo_path, start_date=start_date,
+                                              end_date=end_date, access_token=access_token)
+        if commits is None:
+            # when one branch was requested there is no need to enumerate them all
+            commits = get_all_commits(repo_path=repo_path, start_date=start_date, end_date=end_date,
+                                      access_token=access_token,
+                                      author=author, branch=branch)
+
+    # the loop variables deliberately never reuse the start_date/end_date/
+    # author parameters: rebinding them here silently corrupted the window
+    # every branch after the first was filtered against
+    for branch_name, branch_commits in commits.items():
         # If branch is specified, filter by branch name
         if branch and branch_name != branch:
             continue
 
-        # group commits by author
-        commits_by_author = {}
-        for commit in commits:
-            author = commit["commit"]["author"]["name"]
-            if author not in commits_by_author:
-                commits_by_author[author] = []
-            commits_by_author[author].append(commit)
-
-        for author, commits in commits_by_author.items():
-
-            # sort commits by date
-            commits = sorted(commits, key=lambda x: x["commit"]["author"]["date"], reverse=True)
-
-            # convert string date to datetime
-            for commit in commits:
-                commit["commit"]["author"]["date"] = parse(commit["commit"]["author"]["date"]).replace(tzinfo=None)
-
-            # filter out commits outside the date range
-            commits = [commit for commit in commits if
-                       start_date <= commit["commit"]["author"]["date"] <= end_date]
-
-            # Ignore branches with no commits
-            if len(commits) <= 0:
+        # group commits by author; defaultdict turns the membership
+        # test + insert into a single dict probe per commit. The API returns
+        # commits newest-first, so the first commit older than the window
+        # ends the branch — nothing past it needs parsing at all.
+        commits_by_author = defaultdict(list)
+        for commit in branch_commits:
+            commit_date = parse_commit_date(commit["commit"]["author"]["date"]).replace(tzinfo=None)
+            if commit_date < start_date:
+                break
+            if commit_date > end_date:
                 continue
+            commit["commit"]["author"]["date"] = commit_date
+            commits_by_author[commit["commit"]["author"]["name"]].append(commit)
 
-            end_date = commits[0]["commit"]["author"]["date"]
-            start_date = commits[-1]["commit"]["author"]["date"]
-            messages = [{"messages": commit["commit"]["message"], "sha": commit["sha"]} for commit in commits]
+        for batch_author, batch_commits in commits_by_author.items():
+            # each author's commits keep the branch's descending date order,
+            # so the boundaries are simply the first and last entries
+            batch_end = batch_commits[0]["commit"]["author"]["date"]
+            batch_start = batch_commits[-1]["commit"]["author"]["date"]
+            messages = [{"messages": commit["commit"]["message"], "sha": commit["sha"]} for commit in batch_commits]
 
             # unified results
             results.append({
                 "branch": branch_name,
-                "author": author,
-                "start_date": start_date,
-                "end_date": end_date,
+                "author": batch_author,
+                "start_date": batch_start,
+                "end_date": batch_end,
                 "commit_messages": messages
             })
 
@@ -151,6 +235,9 @@ def fetch_commits_from_local(repo_path, start_date, end_date, branch=None, autho
     Returns:
         list: stores the branch, author, datetime ranges and the commits
     """
+    # imported lazily to keep CLI startup fast
+    from git import Repo, InvalidGitRepositoryError
+
     try:
         repo = Repo(repo_path)
         results = []
@@ -161,23 +248,23 @@ def fetch_commits_from_local(repo_path, start_date, end_date, branch=None, autho
             commits = get_all_unique_commits_local(repo, base_branch_map, start_date, end_date, author)
         else:
             commits = {}
-            remote_branches = repo.git.branch('-r').split('\n')
-            for remote_branch in remote_branches:
-                remote_branch = remote_branch.strip()
-                if "HEAD" in remote_branch:
-                    continue
-
-                branch_commits = list(repo.iter_commits(remote_branch, author=author))
-
-                # sort commits by date
-                branch_commits = sorted(branch_commits, key=lambda x: x.committed_datetime, reverse=True)
-
-                # filter out commits outside the date range
-                branch_commits = [commit for commit in branch_commits if
-                                  start_date <= commit.committed_datetime.replace(tzinfo=None) <= end_date]
-                commits[remote_branch] = branch_commits
-
-        for branch_name, commits in commits.items():
+            remote_branches = list_remote_branches(repo)
+
+            if remote_branches:
+                # each branch walk blocks on a git subprocess, so fan the branches
+                # out across threads instead of walking them one at a time
+                with ThreadPoolExecutor(max_workers=min(len(remote_branches), os.cpu_count() or 4)) as executor:
+                    branch_commit_lists = executor.map(
+                        lambda remote_branch: list_branch_commits(repo, remote_branch, start_date, end_date, author),
+                        remote_branches)
+
+                for remote_branch, branch_commits in zip(remote_branches, branch_commit_lists):
+                    # ordering happens once in the grouping sort below
+                    commits[remote_branch] = branch_commits
+
+        # keep the start_date/end_date/author parameters intact; the loop
+        # binds its own names so later iterations never see corrupted values
+        for branch_name, branch_commits in commits.items():
             # If branch is specified, filter by branch name
             if branch:
                 # remove "origin/" prefix
@@ -185,28 +272,25 @@ def fetch_commits_from_local(repo_path, start_date, end_date, branch=None, autho
                 if stripped_branch_name != branch:
                     continue
 
-            # group commits by author
-            commits_by_author = {}
-            for commit in commits:
-                author = commit.author.name
-                if author not in commits_by_author:
-                    commits_by_author[author] = []
-                commits_by_author[author].append(commit)
-
-            for author, commits in commits_by_author.items():
-                if len(commits) < 0:
-                    continue
+            # one sort orders by author and, within each author, newest
+            # first, so groupby hands out ready-sorted batches without a
+            # dict build plus a second sort per batch
+            ordered = sorted(branch_commits, key=lambda c: (c.author.name, -c.committed_date))
+            for batch_author, batch_group in groupby(ordered, key=lambda c: c.author.name):
+                batch_commits = list(batch_group)
 
-                end_date = commits[0].committed_datetime
-                start_date = commits[-1].committed_datetime
-                messages = [{"messages": commit.message, "sha": commit.hexsha} for commit in commits]
+                # committed_date is an epoch int on both git.Commit and
+                # CommitRecord; convert only the batch boundaries
+                batch_end = datetime.fromtimestamp(batch_commits[0].committed_date)
+                batch_start = datetime.fromtimestamp(batch_commits[-1].committed_date)
+                messages = [{"messages": commit.message, "sha": commit.hexsha} for commit in batch_commits]
 
                 # unified results
                 results.append({
                     "branch": branch_name,
-                    "author": author,
-                    "start_date": start_date,
-                    "end_date": end_date,
+                    "author": batch_author,
+                    "start_date": batch_start,
+                    "end_date": batch_end,
                     "commit_messages": messages
                 })
 
@@ -217,6 +301,166 @@ def fetch_commits_from_local(repo_path, start_date, end_date, branch=None, autho
         raise ValueError(f"Invalid Git repository: {repo_path}")
 
 
+def list_remote_branches(repo):
+    """
+    Lists the remote branch names ("origin/main" style) of a repository.
+    When pygit2 is installed the refdb is read directly in-process, which
+    skips the `git branch -r` subprocess the fallback still spawns.
+
+    Args:
+        repo (git.Repo): The repository whose remote branches are listed.
+
+    Returns:
+        list: The remote branch names, without the symbolic HEAD entry.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        pygit2 = None
+
+    if pygit2 is not None:
+        try:
+            references = pygit2.Repository(repo.git_dir).references
+            return [name[len("refs/remotes/"):] for name in references
+                    if name.startswith("refs/remotes/") and not name.endswith("/HEAD")]
+        except pygit2.GitError:
+            # unreadable repository; let the subprocess path report it
+            pass
+
+    remote_branches = [remote_branch.strip() for remote_branch in repo.git.branch('-r').split('\n')]
+    return [remote_branch for remote_branch in remote_branches
+            if remote_branch and "HEAD" not in remote_branch]
+
+
+# One Actor per unique (name, email) pair instead of one per commit; a busy
+# author on a long branch otherwise costs thousands of identical objects
+_actor_cache = {}
+
+
+def intern_actor(author_name, author_email):
+    """
+    Returns a shared Actor for an author, creating it on first sight. The
+    name and email strings are interned so every commit by the same author
+    points at one copy of each.
+
+    Args:
+        author_name (str): The author name.
+        author_email (str): The author email.
+
+    Returns:
+        git.util.Actor: The shared Actor instance.
+    """
+    from git.util import Actor
+
+    key = (author_name, author_email)
+    actor = _actor_cache.get(key)
+    if actor is None:
+        actor = Actor(sys.intern(author_name), sys.intern(author_email))
+        _actor_cache[key] = actor
+    return actor
+
+
+def list_branch_commits(repo, branch, start_date, end_date, author=None):
+    """
+    Lists the commits on a branch with a single `git rev-list` call.
+
+    iter_commits yields full Commit objects that lazily hydrate trees, parents
+    and authors from the object database; the summary pipeline only needs the
+    sha, date, author and message, so parse those straight from the rev-list
+    output instead.
+
+    Args:
+        repo (git.Repo): The repository to walk.
+        branch (str): The branch name.
+        start_date (datetime): The start date of the date range.
+        end_date (datetime): The end date of the date range.
+        author (str): The author name or email.
+
+    Returns:
+        list: The CommitRecord entries for the branch, newest first.
+    """
+    # pygit2 walks pack files in C with no subprocess per branch; prefer it
+    # when the optional dependency is installed
+    records = list_branch_commits_pygit2(repo.git_dir, branch, start_date, end_date, author)
+    if records is not None:
+        return records
+
+    kwargs = {
+        "since": start_date.isoformat(),
+        "until": end_date.isoformat(),
+        "format": "%H%x00%ct%x00%aN%x00%aE%x00%B%x01",
+    }
+    if author:
+        kwargs["author"] = author
+    output = repo.git.rev_list(branch, **kwargs)
+
+    commits = []
+    for record in output.split("\x01"):
+        record = record.strip("\n")
+        if not record:
+            continue
+        # drop the "commit <sha>" header line rev-list prints before each record
+        record = record.split("\n", 1)[-1]
+        hexsha, timestamp, author_name, author_email, message = record.split("\x00")
+        # keep the raw epoch int; dates are converted once per batch downstream
+        commits.append(CommitRecord(hexsha, int(timestamp),
+                                    intern_actor(author_name, author_email), message))
+    return commits
+
+
+def list_branch_commits_pygit2(git_dir, branch, start_date, end_date, author=None):
+    """
+    Lists the commits on a branch through pygit2, which reads the pack files
+    directly in C instead of spawning a git subprocess. The walk is sorted by
+    commit time, so it stops at the first commit older than the window.
+
+    Args:
+        git_dir (str): The repository's .git directory.
+        branch (str): The branch name, e.g. "origin/main".
+        start_date (datetime): The start date of the date range.
+        end_date (datetime): The end date of the date range.
+        author (str): The author name or email.
+
+    Returns:
+        list: The CommitRecord entries for the branch, newest first, or None
+            when pygit2 is not installed and the caller should fall back to
+            the rev-list path.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        return None
+
+    try:
+        repo = pygit2.Repository(git_dir)
+        ref = (repo.references.get(f"refs/remotes/{branch}")
+               or repo.references.get(f"refs/heads/{branch}"))
+        if ref is None:
+            return None
+
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
+        commits = []
+        for commit in repo.walk(ref.resolve().target, pygit2.GIT_SORT_TIME):
+            commit_time = commit.commit_time
+            if commit_time > end_ts:
+                continue
+            if commit_time < start_ts:
+                # time-sorted walk; everything after this is older still
+                break
+            # each .author access builds a fresh Signature; read it once
+            signature = commit.author
+            if author and author not in signature.name and author not in signature.email:
+                continue
+            commits.append(CommitRecord(str(commit.id), commit_time,
+                                        intern_actor(signature.name, signature.email),
+                                        commit.message))
+        return commits
+    except pygit2.GitError:
+        # unreadable repository or ref; let the rev-list path report it
+        return None
+
+
 def fetch_commits_from_remote(repo_url, start_date, end_date, branch=None, author=None, config=None, cache_dir=None):
     """
     Fetches commits from a remote repository.
@@ -233,13 +477,18 @@ def fetch_commits_from_remote(repo_url, start_date, end_date, branch=None, autho
     Returns:
         list: stores the branch, author, datetime ranges and the commits
     """
+    # imported lazily to keep CLI startup fast
+    from git import Repo, GitCommandError
 
     if config:
         cache_dir = config.get("general", "cache_dir") if not cache_dir else cache_dir
         cache_duration = config.get("general", "cache_duration")
+        fetch_ttl = config.get("general", "fetch_ttl_seconds", fallback=None)
     else:
         cache_dir = get_config_value("general", "cache_dir") if not cache_dir else cache_dir
         cache_duration = get_config_value("general", "cache_duration")
+        fetch_ttl = get_config_value("general", "fetch_ttl_seconds")
+    fetch_ttl = int(fetch_ttl) if fetch_ttl else 300
 
     if not cache_duration:
         cache_duration = 7
@@ -257,40 +506,499 @@ def fetch_commits_from_remote(repo_url, start_date, end_date, branch=None, autho
         else:
             logger.info(f"Using cache directory: {cache_dir}")
 
-    repo_name = repo_url.split("/")[-1].split(".")[0]
+    repo_name = os.path.basename(repo_url)
+    if repo_name.endswith(".git"):
+        repo_name = repo_name[:-len(".git")]
     repo_cache_dir = os.path.join(cache_dir, repo_name)
 
+    repo = None
+    cache_expired = False
+    needs_deepening = False
     if os.path.exists(repo_cache_dir):
         # Check if the cached repository is still valid
-        cache_timestamp = datetime.fromtimestamp(os.path.getmtime(repo_cache_dir))
+        cache_timestamp = datetime.fromtimestamp(last_fetch_time(repo_cache_dir))
         cache_expiry = cache_timestamp + timedelta(days=cache_duration)
+        repo = Repo(repo_cache_dir)
+        boundary = shallow_boundary(repo_cache_dir)
+        if boundary is not None and start_date < boundary:
+            # the shallow history stops after the requested window starts, so
+            # any rev-walk would be silently truncated; a deepening fetch is
+            # required no matter how fresh the cache looks
+            needs_deepening = True
+            logger.info(f"Requested window predates the shallow history of {repo_cache_dir}, deepening.")
         if cache_expiry > datetime.now():
             # Use the cached repository
-            repo = Repo(repo_cache_dir)
             logger.info(f"Using cached repository: {repo_cache_dir}")
         else:
-            # Cache has expired, remove the cached repository
-            shutil.rmtree(repo_cache_dir)
-            logger.info(f"Cache expired. Removing cached repository: {repo_cache_dir}")
-            repo = None
-    else:
-        repo = None
+            # stale, but the objects are still valid — refresh in place
+            # instead of deleting the clone and transferring everything again
+            cache_expired = True
+            logger.info(f"Cache expired. Refreshing cached repository: {repo_cache_dir}")
 
     if repo is None:
         # Clone the remote repository and cache it
         os.makedirs(cache_dir, exist_ok=True)
         logger.info(f"Cloning remote repository: {repo_url}")
-        repo = Repo.clone_from(repo_url, repo_cache_dir, no_checkout=True,
-                               filter='blob:none')  # Clone with minimal history
-        repo.git.fetch(all=True)  # Fetch all branches and tags
+        clone_kwargs = {"no_checkout": True, "filter": "blob:none"}  # Clone with minimal history
+        # a shallow clone implies --single-branch, so ask for all branches
+        # explicitly unless one specific branch was requested
+        multi_options = [f"--shallow-since={start_date:%Y-%m-%d}"]
+        if branch:
+            # only the requested branch is needed, skip every other branch's history
+            clone_kwargs["single_branch"] = True
+            clone_kwargs["branch"] = branch
+        else:
+            multi_options.append("--no-single-branch")
+        try:
+            # limit history to the requested window; git rejects --shallow-since
+            # when no commits fall inside it, so fall back to a full clone
+            repo = Repo.clone_from(repo_url, repo_cache_dir,
+                                   multi_options=multi_options,
+                                   **clone_kwargs)
+        except GitCommandError:
+            repo = Repo.clone_from(repo_url, repo_cache_dir, **clone_kwargs)
+        # no post-clone fetch: --no-single-branch makes the clone itself
+        # create every remote-tracking ref, so a fetch here would only
+        # re-negotiate what was just downloaded
+        write_cached_head(repo_cache_dir, remote_head_sha(repo))
+        record_shallow_boundary(repo_cache_dir, start_date)
+        touch_fetch_sentinel(repo_cache_dir)
         logger.info(f"Cloned repository cached at: {repo_cache_dir}")
+    elif not needs_deepening and not cache_expired and fetch_sentinel_fresh(repo_cache_dir, fetch_ttl):
+        # the cached repository was refreshed moments ago; skip the round trip
+        logger.info(f"Cached repository fetched within the last {fetch_ttl} seconds, skipping fetch.")
     else:
-        # Fetch the latest changes in the repository
-        repo.git.fetch(all=True)
-        logger.info(f"Fetched latest changes from remote repository: {repo_url}")
+        # One ls-remote round trip tells us whether the remote moved at all;
+        # if its HEAD sha matches the one recorded after the last fetch, the
+        # cache is current no matter how old it is and no fetch is needed.
+        # Neither shortcut applies when the history has to be deepened: the
+        # missing commits are old ones, which no HEAD comparison can detect
+        head_sha = remote_head_sha(repo)
+        if not needs_deepening and head_sha and head_sha == read_cached_head(repo_cache_dir):
+            touch_fetch_sentinel(repo_cache_dir)
+            logger.info(f"Remote HEAD unchanged, reusing cached repository: {repo_cache_dir}")
+        else:
+            # Fetch the latest changes in the repository
+            if branch:
+                # only the requested branch is needed; don't refresh the rest,
+                # and don't pull history older than the queried window
+                try:
+                    fetch_args = [f"--shallow-since={start_date:%Y-%m-%d}"]
+                    if f"origin/{branch}" in list_remote_branches(repo):
+                        # negotiate from the tip we already have so the server
+                        # packs only the commits added since the last fetch
+                        fetch_args.append(f"--negotiation-tip=refs/remotes/origin/{branch}")
+                    repo.git.fetch("origin", f"+refs/heads/{branch}:refs/remotes/origin/{branch}",
+                                   *fetch_args)
+                    record_shallow_boundary(repo_cache_dir, start_date)
+                except GitCommandError:
+                    repo.git.fetch(all=True)
+            else:
+                if fetch_all_branches(repo, shallow_since=start_date):
+                    record_shallow_boundary(repo_cache_dir, start_date)
+            write_cached_head(repo_cache_dir, head_sha)
+            touch_fetch_sentinel(repo_cache_dir)
+            logger.info(f"Fetched latest changes from remote repository: {repo_url}")
+
+    # With the remote HEAD known, the parsed batches for this exact query can
+    # be reused from disk — a single file read instead of a history walk
+    head_sha = read_cached_head(repo_cache_dir)
+    batches_key = commit_batches_key(repo_url, branch, author, start_date, end_date, head_sha)
+    if head_sha and not needs_deepening:
+        # a batch cached before a deepening fetch was built from the
+        # truncated history; fall through and rebuild it from the full walk
+        cached_batches = load_commit_batches(cache_dir, batches_key)
+        if cached_batches is not None:
+            logger.info(f'Loaded {len(cached_batches)} commit batches from cache for {repo_url}.')
+            return cached_batches
+
+    # Speed up every subsequent rev-walk over the cached repository
+    write_commit_graph(repo)
 
     # Fetch the commits using the same logic as fetch_commits_from_local()
     results = fetch_commits_from_local(repo_cache_dir, start_date, end_date, branch, author)
+    if head_sha:
+        store_commit_batches(cache_dir, batches_key, results)
 
     logger.info(f'Fetched {len(results)} commits from remote repository: {repo_url}.')
-    return results
\ No newline at end of file
+    return results
+
+
+def commit_batches_key(repo_url, branch, author, start_date, end_date, head_sha):
+    """
+    Builds the cache key for a parsed commit-batch result. The remote HEAD
+    sha is part of the key, so new commits on the remote change the key and
+    stale entries are simply never read again.
+
+    Args:
+        repo_url (str): The remote repository URL.
+        branch (str): The branch name, or None.
+        author (str): The author filter, or None.
+        start_date (datetime): The start date of the date range.
+        end_date (datetime): The end date of the date range.
+        head_sha (str): The remote HEAD sha the cache was built against.
+
+    Returns:
+        str: The hex digest naming the cache file.
+    """
+    import hashlib
+
+    raw = repr((repo_url, branch, author, start_date.isoformat(), end_date.isoformat(), head_sha))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def commit_batches_path(cache_dir, key):
+    """
+    Returns the cache file path for a commit-batch key.
+
+    Args:
+        cache_dir (str): The cache directory.
+        key (str): The commit-batch cache key.
+
+    Returns:
+        str: The cache file path.
+    """
+    return os.path.join(cache_dir, "commits", f"{key}.json")
+
+
+def load_commit_batches(cache_dir, key):
+    """
+    Loads a cached commit-batch result from disk.
+
+    Args:
+        cache_dir (str): The cache directory.
+        key (str): The commit-batch cache key.
+
+    Returns:
+        list: The cached batches with their dates restored, or None on a miss.
+    """
+    import json
+
+    try:
+        with open(commit_batches_path(cache_dir, key)) as batch_file:
+            batches = json.load(batch_file)
+    except (OSError, ValueError):
+        return None
+    for batch in batches:
+        batch["start_date"] = datetime.fromisoformat(batch["start_date"])
+        batch["end_date"] = datetime.fromisoformat(batch["end_date"])
+    return batches
+
+
+def store_commit_batches(cache_dir, key, results):
+    """
+    Writes a commit-batch result to disk atomically, dates as ISO strings.
+
+    Args:
+        cache_dir (str): The cache directory.
+        key (str): The commit-batch cache key.
+        results (list): The batches to cache.
+    """
+    import json
+
+    path = commit_batches_path(cache_dir, key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        serializable = [dict(batch, start_date=batch["start_date"].isoformat(),
+                             end_date=batch["end_date"].isoformat())
+                        for batch in results]
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".batch.")
+        with os.fdopen(fd, "w") as batch_file:
+            json.dump(serializable, batch_file)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # a failed write only costs a history walk next run
+        logger.warning("Could not cache commit batches: %s", str(e))
+
+
+def last_fetch_time(repo_cache_dir):
+    """
+    Returns the time the cached repository last talked to its remote. The
+    directory mtime is only the last resort: it changes whenever git touches
+    any child (gc, commit-graph writes), which made valid caches look stale.
+
+    Args:
+        repo_cache_dir (str): The cached repository directory.
+
+    Returns:
+        float: The last fetch time as a POSIX timestamp.
+    """
+    for candidate in (fetch_sentinel_path(repo_cache_dir),
+                      os.path.join(repo_cache_dir, ".git", "FETCH_HEAD")):
+        try:
+            return os.path.getmtime(candidate)
+        except OSError:
+            continue
+    return os.path.getmtime(repo_cache_dir)
+
+
+def remote_head_sha(repo):
+    """
+    Returns the sha the remote's HEAD currently points at, via one ls-remote
+    round trip. Note that HEAD only tracks the default branch, so a match is
+    combined with the fetch TTL rather than trusted indefinitely.
+
+    Args:
+        repo (git.Repo): The repository whose origin is queried.
+
+    Returns:
+        str: The sha string, or None when the remote can't be reached.
+    """
+    from git import GitCommandError
+
+    try:
+        for line in repo.git.ls_remote("origin", "HEAD").splitlines():
+            if "\t" in line:
+                return line.split("\t", 1)[0]
+    except GitCommandError:
+        pass
+    return None
+
+
+def cached_head_path(repo_cache_dir):
+    """
+    Returns the path of the sidecar file recording the remote HEAD sha seen
+    at the last fetch.
+
+    Args:
+        repo_cache_dir (str): The cached repository directory.
+
+    Returns:
+        str: The sidecar file path.
+    """
+    return os.path.join(repo_cache_dir, ".git", "riddlesolver_cached_head")
+
+
+def read_cached_head(repo_cache_dir):
+    """
+    Reads the remote HEAD sha recorded at the last fetch.
+
+    Args:
+        repo_cache_dir (str): The cached repository directory.
+
+    Returns:
+        str: The recorded sha, or None when none was recorded.
+    """
+    try:
+        with open(cached_head_path(repo_cache_dir)) as head_file:
+            return head_file.read().strip() or None
+    except OSError:
+        return None
+
+
+def write_cached_head(repo_cache_dir, sha):
+    """
+    Records the remote HEAD sha atomically: the sha goes to a temporary file
+    that replaces the sidecar in one rename.
+
+    Args:
+        repo_cache_dir (str): The cached repository directory.
+        sha (str): The sha to record; None clears nothing and is ignored.
+    """
+    if not sha:
+        return
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.join(repo_cache_dir, ".git"),
+                                        prefix=".riddlesolver_head.")
+        with os.fdopen(fd, "w") as head_file:
+            head_file.write(sha)
+        os.replace(tmp_path, cached_head_path(repo_cache_dir))
+    except OSError:
+        # a missing sidecar only costs an extra fetch next run
+        pass
+
+
+def shallow_since_path(repo_cache_dir):
+    """
+    Returns the path of the sidecar file recording the earliest date the
+    shallow history was fetched back to.
+
+    Args:
+        repo_cache_dir (str): The cached repository directory.
+
+    Returns:
+        str: The sidecar file path.
+    """
+    return os.path.join(repo_cache_dir, ".git", "riddlesolver_shallow_since")
+
+
+def shallow_boundary(repo_cache_dir):
+    """
+    Returns the earliest date the cached repository's history reaches.
+
+    A clone with full history has no boundary and returns None. A shallow
+    clone returns the --shallow-since date it was last deepened to; a shallow
+    clone without a recorded date (e.g. a cache created before the sidecar
+    existed) returns datetime.max so the next query deepens it once and
+    records the real boundary.
+
+    Args:
+        repo_cache_dir (str): The cached repository directory.
+
+    Returns:
+        datetime: The boundary date, or None for a full-history clone.
+    """
+    if not os.path.exists(os.path.join(repo_cache_dir, ".git", "shallow")):
+        return None
+    try:
+        with open(shallow_since_path(repo_cache_dir)) as boundary_file:
+            return datetime.fromisoformat(boundary_file.read().strip())
+    except (OSError, ValueError):
+        return datetime.max
+
+
+def record_shallow_boundary(repo_cache_dir, start_date):
+    """
+    Records start_date as the earliest date the shallow history was fetched
+    back to, so a later query for an even earlier window knows it has to
+    deepen the history first. Clones with full history record nothing.
+
+    Args:
+        repo_cache_dir (str): The cached repository directory.
+        start_date (datetime): The date the last --shallow-since fetch used.
+    """
+    if not os.path.exists(os.path.join(repo_cache_dir, ".git", "shallow")):
+        # the clone has full history; drop any stale record
+        try:
+            os.remove(shallow_since_path(repo_cache_dir))
+        except OSError:
+            pass
+        return
+    # git truncates --shallow-since to the date, so the real boundary is
+    # midnight of start_date; record that rather than the exact timestamp
+    boundary = datetime(start_date.year, start_date.month, start_date.day)
+    current = shallow_boundary(repo_cache_dir)
+    if current is not None and current <= boundary:
+        return
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.join(repo_cache_dir, ".git"),
+                                        prefix=".riddlesolver_shallow.")
+        with os.fdopen(fd, "w") as boundary_file:
+            boundary_file.write(boundary.isoformat())
+        os.replace(tmp_path, shallow_since_path(repo_cache_dir))
+    except OSError:
+        # a missing record only costs an extra deepening fetch next run
+        pass
+
+
+def fetch_sentinel_path(repo_cache_dir):
+    """
+    Returns the path of the sentinel file recording the last fetch time.
+
+    Args:
+        repo_cache_dir (str): The cached repository directory.
+
+    Returns:
+        str: The sentinel file path.
+    """
+    return os.path.join(repo_cache_dir, ".git", "riddlesolver_last_fetch")
+
+
+def fetch_sentinel_fresh(repo_cache_dir, fetch_ttl):
+    """
+    Checks whether the cached repository was fetched within the TTL.
+
+    Args:
+        repo_cache_dir (str): The cached repository directory.
+        fetch_ttl (int): Maximum age of the last fetch, in seconds.
+
+    Returns:
+        bool: True when the last fetch is recent enough to skip a new one.
+    """
+    try:
+        return time.time() - os.path.getmtime(fetch_sentinel_path(repo_cache_dir)) < fetch_ttl
+    except OSError:
+        return False
+
+
+def touch_fetch_sentinel(repo_cache_dir):
+    """
+    Records the current time as the last fetch time of a cached repository.
+
+    Args:
+        repo_cache_dir (str): The cached repository directory.
+    """
+    try:
+        with open(fetch_sentinel_path(repo_cache_dir), "a"):
+            os.utime(fetch_sentinel_path(repo_cache_dir), None)
+    except OSError:
+        # a missing sentinel only costs an extra fetch next run
+        pass
+
+
+def fetch_all_branches(repo, shallow_since=None):
+    """
+    Fetches every branch from origin, one fetch per ref fanned out across a
+    thread pool. `fetch --all` transfers the refs serially over a single
+    connection, so on repositories with many branches the per-ref fan-out
+    keeps the network saturated instead of waiting on each ref in turn.
+
+    Args:
+        repo (git.Repo): The repository to update.
+        shallow_since (datetime): When given, each ref's history is limited
+            to commits after this date so the fetch never pulls the history
+            the shallow clone deliberately skipped.
+
+    Returns:
+        bool: True when the fetches honoured shallow_since, False when they
+            fell back to a plain fetch that left the shallow boundary alone.
+    """
+    from git import GitCommandError
+
+    extra_args = []
+    if shallow_since:
+        extra_args.append(f"--shallow-since={shallow_since:%Y-%m-%d}")
+
+    try:
+        heads = [line.split("\t", 1)[1]
+                 for line in repo.git.ls_remote("--heads", "origin").splitlines() if "\t" in line]
+    except GitCommandError:
+        heads = []
+
+    if not heads:
+        repo.git.fetch("--all", *extra_args)
+        return True
+
+    # refs already tracked locally can negotiate from their last-seen tip,
+    # so refresh fetches transfer only the commits added since the last run
+    local_tips = set(list_remote_branches(repo))
+
+    def fetch_ref(ref):
+        branch_name = ref[len("refs/heads/"):]
+        ref_args = list(extra_args)
+        if f"origin/{branch_name}" in local_tips:
+            ref_args.append(f"--negotiation-tip=refs/remotes/origin/{branch_name}")
+        # --no-write-fetch-head keeps concurrent fetches from fighting over
+        # the FETCH_HEAD lock
+        repo.git.fetch("origin", f"+{ref}:refs/remotes/origin/{branch_name}",
+                       *ref_args, no_write_fetch_head=True)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(len(heads), 8)) as executor:
+            # consume the iterator so any fetch error surfaces here
+            list(executor.map(fetch_ref, heads))
+        return True
+    except GitCommandError:
+        # e.g. older git without --no-write-fetch-head, or a window with no
+        # commits that --shallow-since rejects; do it the plain serial way
+        repo.git.fetch(all=True)
+        return False
+
+
+def write_commit_graph(repo):
+    """
+    Writes git's commit-graph file so later rev-walks read commit metadata
+    from the graph instead of parsing every object.
+
+    Args:
+        repo (git.Repo): The repository to write the commit-graph for.
+    """
+    from git import GitCommandError
+
+    try:
+        repo.git.config('core.commitGraph', 'true')
+        repo.git.config('gc.writeCommitGraph', 'true')
+        repo.git.commit_graph('write', '--reachable', '--changed-paths')
+    except GitCommandError:
+        # older git versions don't support commit-graph; walks still work without it
+        logger.warning("git commit-graph is not supported by this git version, skipping.")
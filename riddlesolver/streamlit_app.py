@@ -7,10 +7,23 @@ from riddlesolver.repository import fetch_commits
 from riddlesolver.summary import generate_commit_summary
 from riddlesolver.utils import get_repository_type
 
-# Load the configuration
-config = configparser.ConfigParser()
-config.add_section("github")
-config.add_section("openai")
+
+# Streamlit re-runs this whole script on every widget interaction, so the
+# URL parse is cached per URL and the config object is built once per session
+@st.cache_data
+def repo_type_of(url):
+    return get_repository_type(url)
+
+
+@st.cache_resource
+def load_config():
+    config = configparser.ConfigParser()
+    config.add_section("github")
+    config.add_section("openai")
+    return config
+
+
+config = load_config()
 
 # Set the page title
 st.set_page_config(page_title="RiddleSolver", page_icon=":mag_right:")
@@ -43,7 +56,7 @@ if st.button("Generate Summary"):
     with st.spinner("Generating summary..."):
         if repo_url and access_token and api_key:
             try:
-                repo_type = get_repository_type(repo_url)
+                repo_type = repo_type_of(repo_url)
                 if repo_type == "github":
                     repo_name = repo_url.split("/")[-1]
                     # Update the configuration temporarily
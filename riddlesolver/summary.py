@@ -1,16 +1,33 @@
-from collections import defaultdict
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+from itertools import groupby
+from pathlib import Path
 import logging
 
-import openai
-
-from riddlesolver.constants import SUMMARY_PROMPT_TEMPLATE
+from riddlesolver.constants import SUMMARY_SYSTEM_PROMPT
 from riddlesolver.utils import format_date, handle_error, calculate_days_between_dates
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Maximum number of OpenAI requests in flight at once, to stay clear of rate limits
+MAX_CONCURRENT_REQUESTS = 10
+# Number of attempts per request when the API reports a rate limit
+MAX_RETRIES = 5
+# Seconds between status polls of a submitted batch job
+BATCH_POLL_INTERVAL = 30
+# Where generated summaries are cached between runs
+SUMMARY_CACHE_DIR = Path.home() / ".cache" / "riddlesolver" / "summaries"
+# Largest request, in characters, that is collapsed into a single combined
+# call — roughly 12k tokens at ~4 characters per token, a conservative slice
+# of the context window
+COMBINED_CALL_MAX_CHARS = 48_000
+
 
-def generate_commit_summary(batched_commits, config, output_file=None):
+def generate_commit_summary(batched_commits, config, output_file=None, batch_mode=False, no_cache=False):
     """
     Generates a summary of commits within the specified date range.
 
@@ -18,6 +35,9 @@ def generate_commit_summary(batched_commits, config, output_file=None):
         batched_commits (list): A list mapping authors to branches and their corresponding commits.
         config (dict): The configuration dictionary.
         output_file (str): The path to the output file.
+        batch_mode (bool): Whether to submit requests through OpenAI's
+            discounted batch endpoint instead of real-time calls.
+        no_cache (bool): Whether to bypass the on-disk summary cache.
     """
     if not batched_commits or len(batched_commits) == 0:
         logger.warning("No commits found within the specified date range.")
@@ -25,10 +45,19 @@ def generate_commit_summary(batched_commits, config, output_file=None):
 
     logger.info("=" * 50)
 
-    summary = generate_summary(batched_commits, config)
-
     if output_file:
-        save_summary_to_file(summary, output_file)
+        # stream each batch to disk as it is formatted instead of buffering
+        # the whole summary and writing it at the end
+        try:
+            with open(output_file, "w", buffering=1 << 16) as file:
+                summary = generate_summary(batched_commits, config, output_stream=file,
+                                           batch_mode=batch_mode, no_cache=no_cache)
+            logger.info(f"Summary saved to {output_file}")
+        except IOError as e:
+            logger.error(f"Error saving summary to file: {str(e)}")
+            handle_error(e)
+    else:
+        summary = generate_summary(batched_commits, config, batch_mode=batch_mode, no_cache=no_cache)
 
     logger.info("=" * 50)
     logger.info("Summary generation complete.")
@@ -46,29 +75,67 @@ def group_commits_by_author_and_branch(commits, branch_names):
     Returns:
         dict: A dictionary mapping authors to branches and their corresponding commits.
     """
-    commit_batches = defaultdict(lambda: defaultdict(list))
-    for commit in commits:
-        author = commit.author.email if hasattr(commit, 'author') else commit['commit']['author']['email']
-        for branch_name in branch_names:
-            if branch_name == commit.branch if hasattr(commit, 'branch') else True:
-                commit_batches[author][branch_name].append(commit)
+    commit_batches = {}
+    if not commits:
+        return commit_batches
+
+    # a commit list is homogeneous (GitHub API dicts or git objects), so pick
+    # the accessors once up front instead of type-checking every commit
+    if isinstance(commits[0], dict):
+        def author_email(commit):
+            return commit['commit']['author']['email']
+
+        def commit_sha(commit):
+            return commit['sha']
+    else:
+        def author_email(commit):
+            return commit.author.email
+
+        def commit_sha(commit):
+            return commit.hexsha
+
+    seen = set()
+    # one sort + groupby pass instead of a nested-defaultdict walk
+    for author, author_commits in groupby(sorted(commits, key=author_email), key=author_email):
+        branches = commit_batches.setdefault(author, {})
+        for commit in author_commits:
+            sha = commit_sha(commit)
+            if sha in seen:
+                continue
+            seen.add(sha)
+            branch = getattr(commit, 'branch', None)
+            for branch_name in branch_names:
+                if branch is None or branch_name == branch:
+                    branches.setdefault(branch_name, []).append(commit)
     return commit_batches
 
 
-def generate_summary(commit_batches, config):
+def generate_summary(commit_batches, config, output_stream=None, batch_mode=False, no_cache=False):
     """
     Generates a summary of commit batches.
 
     Args:
         commit_batches (list): A list mapping authors to branches and their corresponding commits.
         config (config): The configuration dictionary.
+        output_stream: An optional writable text file the summary is streamed to.
+        batch_mode (bool): Whether to use OpenAI's batch endpoint.
+        no_cache (bool): Whether to bypass the on-disk summary cache.
 
     Returns:
         str: The generated summary.
     """
 
     summary = []
-    for idx, commit_object in enumerate(commit_batches):
+
+    def console(text):
+        # progress logs go through the logger; in quiet mode the summary
+        # itself still has to reach stdout
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(text)
+        else:
+            print(text)
+
+    def emit(idx, commit_object, openai_summary):
         branch_name = commit_object['branch']
         author = commit_object['author']
         start_date = commit_object['start_date']
@@ -76,7 +143,6 @@ def generate_summary(commit_batches, config):
         commit_messages = commit_object['commit_messages']
         commit_messages = [message['messages'] for message in commit_messages]
         duration = max(1, calculate_days_between_dates(start_date, end_date))
-        openai_summary = get_openai_summary(commit_messages, branch_name, config)
         if openai_summary:
             day_plural = "day" if duration == 1 else "days"
             batch_summary = [
@@ -88,81 +154,420 @@ def generate_summary(commit_batches, config):
             ]
             summary_result = "\n".join(batch_summary)
             summary.append(summary_result)
-            logger.info(f"Generated summary for author: {author}, branch: {branch_name}")
+            logger.info("Generated summary for author: %s, branch: %s", author, branch_name)
         else:
             summary_result = f"Failed to generate summary for author: {author}, branch: {branch_name}"
             summary.append(summary_result)
-            logger.warning(f"Failed to generate summary for author: {author}, branch: {branch_name}")
+            logger.warning("Failed to generate summary for author: %s, branch: %s", author, branch_name)
 
         # print summary result to the console
-        logger.info(summary_result)
+        console(summary_result)
+
+        if output_stream:
+            if idx > 0:
+                output_stream.write("\n")
+            output_stream.write(summary_result)
 
         if idx < len(commit_batches) - 1:
             # separator between different batches
             summary.append("-" * 50)
-            logger.info("-" * 50)
+            console("-" * 50)
+            if output_stream:
+                output_stream.write("\n" + "-" * 50)
+        if output_stream:
+            # surface each batch on disk as soon as it is formatted
+            output_stream.flush()
+
+    if batch_mode:
+        for idx, (commit_object, openai_summary) in enumerate(
+                zip(commit_batches, gather_summaries_batch(commit_batches, config))):
+            emit(idx, commit_object, openai_summary)
+    else:
+        # summaries are emitted one by one as their requests finish, so the
+        # first batch reaches the console/file while later calls are in flight
+        asyncio.run(stream_summaries(commit_batches, config, emit, no_cache=no_cache))
 
     return "\n".join(summary)
 
 
-def get_openai_summary(commit_messages, branch_name, config):
+def build_messages(branch_name, commit_messages):
     """
-    Generates a summary of commit messages using the OpenAI API.
+    Builds the chat messages for a batch of commit messages. The static
+    instructions go as a byte-identical system message so OpenAI's prompt
+    caching can reuse the prefix; only the branch and commits vary.
 
     Args:
+        branch_name (str): The branch name.
         commit_messages (list): The list of commit messages.
+
+    Returns:
+        list: The chat messages for the completions API.
+    """
+    return [
+        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+        {"role": "user", "content": f'Branch: "{branch_name}"\n\nCommit messages:\n{commit_messages}'},
+    ]
+
+
+def summary_cache_key(model, branch_name, commit_messages):
+    """
+    Computes the cache key for a batch of commit messages.
+
+    Args:
+        model (str): The OpenAI model name.
         branch_name (str): The branch name.
+        commit_messages (list): The list of commit messages.
+
+    Returns:
+        str: The hex digest identifying this prompt.
+    """
+    return hashlib.sha256(f"{model}\0{branch_name}\0{commit_messages}".encode("utf-8")).hexdigest()
+
+
+def load_cached_summary(key, ttl_days):
+    """
+    Returns the cached summary for a key, or None when absent or expired.
+
+    Args:
+        key (str): The cache key.
+        ttl_days (int): Number of days a cached summary stays valid.
+
+    Returns:
+        str: The cached summary, or None.
+    """
+    path = SUMMARY_CACHE_DIR / key[:2] / key
+    try:
+        if time.time() - path.stat().st_mtime <= ttl_days * 86400:
+            return path.read_text()
+    except OSError:
+        pass
+    return None
+
+
+def store_cached_summary(key, summary):
+    """
+    Writes a summary to the cache atomically.
+
+    Args:
+        key (str): The cache key.
+        summary (str): The summary text to store.
+    """
+    path = SUMMARY_CACHE_DIR / key[:2] / key
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(summary)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # a broken cache should never fail the run
+        logger.warning(f"Could not write summary cache entry: {str(e)}")
+
+
+def cache_settings(config, no_cache):
+    """
+    Resolves the summary-cache settings from the configuration.
+
+    Args:
         config (configparser.ConfigParser): The configuration object.
+        no_cache (bool): Whether caching was disabled on the command line.
 
     Returns:
-        str: The generated summary.
+        tuple: (enabled, ttl_days)
     """
-    model = config.get("openai", "model")
+    if no_cache:
+        return False, 0
+    enabled = config.get("cache", "enabled", fallback="true").lower() in ("1", "true", "yes", "on")
+    ttl_days = int(config.get("cache", "ttl_days", fallback="30"))
+    return enabled, ttl_days
+
+
+async def stream_summaries(commit_batches, config, emit, no_cache=False):
+    """
+    Requests summaries for all commit batches concurrently and hands each one
+    to `emit` in batch order as soon as it is available, instead of holding
+    every result until the slowest request finishes.
+
+    Args:
+        commit_batches (list): A list mapping authors to branches and their corresponding commits.
+        config (configparser.ConfigParser): The configuration object.
+        emit (callable): Called as `emit(idx, commit_object, summary)` per batch.
+        no_cache (bool): Whether to bypass the on-disk summary cache.
+    """
+    # imported lazily to keep CLI startup fast
+    import openai
+
     openai_api_key = config.get("openai", "api_key")
     base_url = config.get("openai", "base_url")
+    model = config.get("openai", "model")
+    cache_enabled, cache_ttl_days = cache_settings(config, no_cache)
 
-    client = openai.Client(api_key=openai_api_key, base_url=base_url)
+    # a single client is shared across all requests for connection pooling
+    client = make_async_client(openai_api_key, base_url)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    # resolve cached summaries up front; only misses go to the API
+    summaries = [None] * len(commit_batches)
+    pending = []
+    for idx, commit_object in enumerate(commit_batches):
+        commit_messages = [message['messages'] for message in commit_object['commit_messages']]
+        key = summary_cache_key(model, commit_object['branch'], commit_messages)
+        if cache_enabled:
+            cached = load_cached_summary(key, cache_ttl_days)
+            if cached:
+                logger.info(f"Using cached summary for branch: {commit_object['branch']}")
+                summaries[idx] = cached
+                continue
+        pending.append((idx, commit_object, commit_messages, key))
+
+    async def bounded_summary(commit_object, commit_messages, key):
+        async with semaphore:
+            result = await get_openai_summary(client, commit_messages, commit_object['branch'], model)
+        if cache_enabled and result:
+            store_cached_summary(key, result)
+        return result
+
+    tasks = {}
     try:
-        response = client.chat.completions.create(
+        if len(pending) > 1:
+            # several small batches fit in one request; collapsing them saves
+            # a full round trip per batch
+            total_chars = sum(len(str(commit_messages)) for _, _, commit_messages, _ in pending)
+            if total_chars <= COMBINED_CALL_MAX_CHARS:
+                combined = await get_combined_summaries(client, pending, model)
+                if combined is not None:
+                    missed = []
+                    for entry in pending:
+                        idx, _, _, key = entry
+                        result = combined.get(idx)
+                        if result:
+                            summaries[idx] = result
+                            if cache_enabled:
+                                store_cached_summary(key, result)
+                        else:
+                            missed.append(entry)
+                    pending = missed
+
+        for idx, commit_object, commit_messages, key in pending:
+            tasks[idx] = asyncio.ensure_future(bounded_summary(commit_object, commit_messages, key))
+        for idx, commit_object in enumerate(commit_batches):
+            emit(idx, commit_object, summaries[idx] if idx not in tasks else await tasks[idx])
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        await client.close()
+
+
+def make_async_client(api_key, base_url):
+    """
+    Builds the shared OpenAI client. All concurrent requests go to a single
+    host, so the underlying httpx client gets an explicit connection limit
+    and, when the h2 package is available, HTTP/2 so the in-flight requests
+    multiplex over one connection instead of opening one socket each.
+
+    Args:
+        api_key (str): The OpenAI API key.
+        base_url (str): The OpenAI API base URL.
+
+    Returns:
+        openai.AsyncClient: The configured client.
+    """
+    import openai
+
+    try:
+        import httpx
+
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        http_client = openai.DefaultAsyncHttpxClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+        return openai.AsyncClient(api_key=api_key, base_url=base_url, http_client=http_client)
+    except (ImportError, AttributeError):
+        # older openai/httpx versions; the default transport still works
+        return openai.AsyncClient(api_key=api_key, base_url=base_url)
+
+
+async def get_combined_summaries(client, pending, model):
+    """
+    Summarizes several commit batches with a single chat call. The model is
+    asked for a JSON object mapping group ids to summaries, which amortizes
+    one round trip across all the groups.
+
+    Args:
+        client (openai.AsyncClient): The shared OpenAI client.
+        pending (list): (idx, commit_object, commit_messages, key) tuples.
+        model (str): The OpenAI model name.
+
+    Returns:
+        dict: Batch index to summary, or None when the combined call failed
+            and the caller should fall back to per-batch requests.
+    """
+    import json
+
+    import openai
+
+    sections = [f'Group {idx} (branch "{commit_object["branch"]}"):\n{commit_messages}'
+                for idx, commit_object, commit_messages, _ in pending]
+    instructions = (
+        SUMMARY_SYSTEM_PROMPT
+        + "\n\nSeveral groups of commit messages follow. Summarize each group independently"
+          " in the format above and respond with a JSON object of the form"
+          ' {"summaries": [{"id": <group number>, "summary": "<summary>"}]}.'
+    )
+    messages = [
+        {"role": "system", "content": instructions},
+        {"role": "user", "content": "\n\n".join(sections)},
+    ]
+    try:
+        response = await client.chat.completions.create(
             model=model,
-            messages=[{
-                "role": "user",
-                "content": SUMMARY_PROMPT_TEMPLATE.format(branch_name=branch_name, commit_messages=commit_messages)
-            }]
+            messages=messages,
+            response_format={"type": "json_object"},
         )
-        if response.choices:
-            summary = response.choices[0].message.content.strip()
-            logger.info(f"Generated summary using OpenAI API: {summary}")
-            return summary
-        else:
-            logger.warning("OpenAI API returned an empty response.")
-            return None
-    except openai.RateLimitError:
-        logger.error("OpenAI API request exceeded rate limit.")
+        payload = json.loads(response.choices[0].message.content)
+        return {int(entry["id"]): entry["summary"].strip()
+                for entry in payload.get("summaries", []) if entry.get("summary")}
+    except (openai.OpenAIError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Combined summary request failed, falling back to per-batch calls: {str(e)}")
         return None
+
+
+def gather_summaries_batch(commit_batches, config):
+    """
+    Submits all prompts as one job to OpenAI's batch endpoint, which charges
+    half the real-time price and promises results within 24 hours. Suited to
+    unattended runs where latency doesn't matter.
+
+    Args:
+        commit_batches (list): A list mapping authors to branches and their corresponding commits.
+        config (configparser.ConfigParser): The configuration object.
+
+    Returns:
+        list: The generated summaries, in the same order as the commit batches.
+    """
+    import json
+    import time
+
+    import openai
+
+    openai_api_key = config.get("openai", "api_key")
+    base_url = config.get("openai", "base_url")
+    model = config.get("openai", "model")
+
+    client = openai.Client(api_key=openai_api_key, base_url=base_url)
+
+    lines = []
+    for idx, commit_object in enumerate(commit_batches):
+        commit_messages = [message['messages'] for message in commit_object['commit_messages']]
+        lines.append(json.dumps({
+            "custom_id": str(idx),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": build_messages(commit_object['branch'], commit_messages)
+            }
+        }))
+
+    summaries = [None] * len(commit_batches)
+    try:
+        batch_file = client.files.create(file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+                                         purpose="batch")
+        batch = client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions",
+                                      completion_window="24h")
+        logger.info(f"Submitted batch {batch.id} with {len(lines)} requests. Waiting for completion...")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            logger.error(f"OpenAI batch {batch.id} finished with status: {batch.status}")
+            return summaries
+
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line:
+                continue
+            result = json.loads(line)
+            response = result.get("response")
+            if response and response.get("status_code") == 200:
+                choices = response["body"].get("choices")
+                if choices:
+                    summaries[int(result["custom_id"])] = choices[0]["message"]["content"].strip()
     except openai.AuthenticationError:
         logger.error("OpenAI API authentication failed. Please check your API key.")
-        return None
     except openai.APIError as e:
         logger.error(f"OpenAI API Error: {str(e)}")
-        return None
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}")
-        return None
+    return summaries
 
 
-def save_summary_to_file(summary, output_file):
+async def get_openai_summary(client, commit_messages, branch_name, model):
     """
-    Saves the summary to a file.
+    Generates a summary of commit messages using the OpenAI API.
 
     Args:
-        summary (str): The summary to save.
-        output_file (str): The path to the output file.
+        client (openai.AsyncClient): The shared OpenAI client.
+        commit_messages (list): The list of commit messages.
+        branch_name (str): The branch name.
+        model (str): The OpenAI model name.
+
+    Returns:
+        str: The generated summary.
     """
-    try:
-        with open(output_file, "w") as file:
-            file.write(summary)
-        logger.info(f"Summary saved to {output_file}")
-    except IOError as e:
-        logger.error(f"Error saving summary to file: {str(e)}")
-        handle_error(e)
\ No newline at end of file
+    import openai
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            # stream the completion so tokens are consumed as they arrive
+            # instead of buffering the whole response body; errors surface at
+            # the first chunk rather than after the full generation
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=build_messages(branch_name, commit_messages),
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            parts = []
+            usage = None
+            async for chunk in stream:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                usage = getattr(chunk, "usage", None) or usage
+            if parts:
+                cached_tokens = getattr(getattr(usage, "prompt_tokens_details", None),
+                                        "cached_tokens", None)
+                if cached_tokens:
+                    logger.info(f"OpenAI served {cached_tokens} prompt tokens from its cache.")
+                summary = "".join(parts).strip()
+                logger.info("Generated summary using OpenAI API: %s", summary)
+                return summary
+            else:
+                logger.warning("OpenAI API returned an empty response.")
+                return None
+        except openai.RateLimitError:
+            if attempt < MAX_RETRIES - 1:
+                # exponential backoff before retrying: 1s, 2s, 4s, ...
+                delay = 2 ** attempt
+                logger.warning(f"OpenAI API request exceeded rate limit. Retrying in {delay} seconds.")
+                await asyncio.sleep(delay)
+                continue
+            logger.error("OpenAI API request exceeded rate limit.")
+            return None
+        except openai.AuthenticationError:
+            logger.error("OpenAI API authentication failed. Please check your API key.")
+            return None
+        except openai.APIError as e:
+            logger.error(f"OpenAI API Error: {str(e)}")
+            return None
+        except Exception as e:
+            logger.error(f"An error occurred: {str(e)}")
+            return None
\ No newline at end of file
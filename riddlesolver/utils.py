@@ -1,11 +1,185 @@
+import copy
+import json
+import logging
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import parse_qs, urlencode, urlparse
 
 import requests
-from dateutil.parser import parse
+from requests.adapters import HTTPAdapter, Retry
 
 from riddlesolver.constants import DATE_FORMAT
 
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# GitHub link shapes accepted by extract_owner_repo, compiled once at import
+# instead of per call through the re module's cache lookup. The HTTPS form
+# drops a trailing .git like the SSH form always did, so the GitHub API never
+# sees an "owner/repo.git" path.
+HTTPS_LINK_RE = re.compile(r'https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/|$)')
+SSH_LINK_RE = re.compile(r'git@github\.com:([^/]+)/([^/]+)\.git')
+
+# URL prefixes classifying repositories, built once instead of allocating the
+# tuples on every get_repository_type call
+GITHUB_PREFIXES = ("https://github.com/", "http://github.com/", "git@github.com:")
+GITLAB_PREFIXES = ("https://gitlab.com/", "http://gitlab.com/", "git@gitlab.com:")
+REMOTE_PREFIXES = ("https://", "http://", "git@")
+
+# Shared session so GitHub API calls reuse pooled TLS connections instead of
+# opening a fresh one per request; transient gateway errors retry with backoff.
+_github_session = None
+
+
+def get_github_session():
+    """
+    Returns the shared requests session used for GitHub API calls.
+
+    Returns:
+        requests.Session: The shared session with connection pooling.
+    """
+    global _github_session
+    if _github_session is None:
+        session = requests.Session()
+        # 429 is retried too, honouring GitHub's Retry-After header, so a
+        # rate-limited burst backs off instead of surfacing an error payload
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                              max_retries=Retry(total=5, backoff_factor=0.5,
+                                                status_forcelist=[429, 500, 502, 503, 504]))
+        session.mount("https://", adapter)
+        _github_session = session
+    return _github_session
+
+
+# ETags from previous runs, persisted next to the cached repositories; when
+# GitHub answers 304 Not Modified the stored body is reused without a refetch.
+ETAG_STORE_PATH = os.path.expanduser("~/.cache/repo_cache/etags.json")
+
+_etag_store = None
+_etag_lock = threading.Lock()
+
+
+def _load_etag_store():
+    """
+    Loads the persisted ETag store, once per process.
+
+    Returns:
+        dict: A mapping of request URLs to their etag and cached body.
+    """
+    global _etag_store
+    if _etag_store is None:
+        try:
+            with open(ETAG_STORE_PATH) as store_file:
+                _etag_store = json.load(store_file)
+        except (OSError, ValueError):
+            _etag_store = {}
+    return _etag_store
+
+
+def _save_etag_store():
+    """
+    Writes the ETag store to disk atomically, mirroring the config-file write:
+    a temp file in the same directory replaced in one rename.
+    """
+    try:
+        # serialize under the lock: other threads keep adding entries while
+        # fetch_all_pages fans out per branch, and json.dump over a dict that
+        # changes size mid-iteration raises RuntimeError
+        with _etag_lock:
+            serialized = json.dumps(_etag_store)
+        os.makedirs(os.path.dirname(ETAG_STORE_PATH), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(ETAG_STORE_PATH), prefix=".etags.")
+        with os.fdopen(fd, "w") as store_file:
+            store_file.write(serialized)
+        os.replace(tmp_path, ETAG_STORE_PATH)
+    except OSError as e:
+        logger.warning("Could not persist ETag cache: %s", str(e))
+
+
+def conditional_get(session, url, headers, params):
+    """
+    Issues a GET with If-None-Match when an ETag from a previous run is known.
+    A 304 Not Modified answer carries no body, so the stored payload from the
+    matching 200 response is returned instead.
+
+    Args:
+        session (requests.Session): The session to send the request through.
+        url (str): The endpoint URL.
+        headers (dict): The request headers.
+        params (dict): The query parameters.
+
+    Returns:
+        tuple: The JSON payload and the Link rel="last" URL (or None).
+    """
+    key = f"{url}?{urlencode(sorted(params.items()))}"
+    store = _load_etag_store()
+    entry = store.get(key)
+    request_headers = dict(headers)
+    if entry:
+        request_headers["If-None-Match"] = entry["etag"]
+
+    response = session.get(url, headers=request_headers, params=params)
+    # the stored body is copied on the way in and on the way out: callers
+    # rewrite fields in place (fetch_commits_from_github turns the date
+    # strings into datetimes), and a shared body would leak those mutations
+    # into the persisted store and into later 304 replays
+    if response.status_code == 304 and entry:
+        return copy.deepcopy(entry["body"]), entry.get("last")
+
+    payload = response.json()
+    etag = response.headers.get("ETag")
+    last = response.links.get("last", {}).get("url")
+    if etag and isinstance(payload, list):
+        with _etag_lock:
+            store[key] = {"etag": etag, "body": copy.deepcopy(payload), "last": last}
+    return payload, last
+
+
+def fetch_all_pages(url, headers, params=None):
+    """
+    Fetches every page of a paginated GitHub list endpoint. Without explicit
+    pagination GitHub silently caps responses at 30 items. The first request
+    asks for 100 items per page; any remaining pages revealed by the
+    Link: rel="last" header are fetched in parallel.
+
+    Args:
+        url (str): The endpoint URL.
+        headers (dict): The request headers.
+        params (dict): Additional query parameters.
+
+    Returns:
+        list: The combined items from every page.
+    """
+    session = get_github_session()
+    params = dict(params or {})
+    params["per_page"] = 100
+
+    items, last = conditional_get(session, url, headers, params)
+    if not isinstance(items, list):
+        # error payloads come back as dicts; let callers handle them as before
+        return items
+
+    if not last:
+        _save_etag_store()
+        return items
+    last_page = int(parse_qs(urlparse(last).query)["page"][0])
+
+    def get_page(page):
+        page_params = dict(params)
+        page_params["page"] = page
+        return conditional_get(session, url, headers, page_params)[0]
+
+    with ThreadPoolExecutor(max_workers=min(8, last_page - 1)) as executor:
+        for page_items in executor.map(get_page, range(2, last_page + 1)):
+            if isinstance(page_items, list):
+                items.extend(page_items)
+    _save_etag_store()
+    return items
+
 
 def parse_date(date_string):
     """
@@ -17,7 +191,10 @@ def parse_date(date_string):
     Returns:
         datetime: The parsed datetime object.
     """
-    return datetime.strptime(date_string, DATE_FORMAT)
+    # faster than strptime, which re-parses the format string and consults
+    # locale data on every call; the accepted format is fixed (YYYY-MM-DD)
+    year, month, day = date_string.split("-")
+    return datetime(int(year), int(month), int(day))
 
 
 def calculate_days_between_dates(start_date, end_date):
@@ -31,10 +208,12 @@ def calculate_days_between_dates(start_date, end_date):
     Returns:
         int: The number of days between the two dates.
     """
+    # dates arrive as datetime objects from every fetch path; the string
+    # branches only guard stray ISO input and skip dateutil's format sniffing
     if isinstance(start_date, str):
-        start_date = parse(start_date)
+        start_date = datetime.fromisoformat(start_date)
     if isinstance(end_date, str):
-        end_date = parse(end_date)
+        end_date = datetime.fromisoformat(end_date)
     return (end_date - start_date).days
 
 
@@ -49,7 +228,7 @@ def format_date(date):
         str: The formatted date string.
     """
     if isinstance(date, str):
-        date = parse(date)
+        date = datetime.fromisoformat(date)
     return date.strftime(DATE_FORMAT)
 
 
@@ -91,11 +270,11 @@ def get_repository_type(repo_path):
     Returns:
         str: The repository type (github, gitlab, local, or remote).
     """
-    if repo_path.startswith(("https://github.com/", "http://github.com/", "git@github.com:")):
+    if repo_path.startswith(GITHUB_PREFIXES):
         return "github"
-    elif repo_path.startswith(("https://gitlab.com/", "http://gitlab.com/", "git@gitlab.com:")):
+    elif repo_path.startswith(GITLAB_PREFIXES):
         return "gitlab"
-    elif repo_path.startswith(("https://", "http://", "git@")):
+    elif repo_path.startswith(REMOTE_PREFIXES):
         return "remote"
     else:
         return "local"
@@ -111,21 +290,11 @@ def extract_owner_repo(github_link):
     Returns:
         str: The owner and repository name in the format "owner/repo".
     """
-    # Define regular expression patterns
-    https_pattern = r'https?://github\.com/([^/]+)/([^/]+)'
-    ssh_pattern = r'git@github\.com:([^/]+)/([^/]+)\.git'
-
-    # Try matching with HTTPS pattern
-    match = re.match(https_pattern, github_link)
-    if match:
-        owner, repo = match.groups()
-        return f'{owner}/{repo}'
-
-    # Try matching with SSH pattern
-    match = re.match(ssh_pattern, github_link)
-    if match:
-        owner, repo = match.groups()
-        return f'{owner}/{repo}'
+    for pattern in (HTTPS_LINK_RE, SSH_LINK_RE):
+        match = pattern.match(github_link)
+        if match:
+            owner, repo = match.groups()
+            return f'{owner}/{repo}'
 
     # If no match found, return None
     return None
@@ -142,34 +311,26 @@ def remove_duplicated_commits(commits):
         list: The list of unique commits.
     """
 
-    unique_commits = []
-    # Sort by author, and move 'main' branch to the beginning
-    commits = sorted(
-        commits,
-        key=lambda x: (x['author'], x['branch'] != 'main'),
-    )
-
-    # if there is a main branch in the list, move it to the front
+    # Order main-branch batches first (so shared commits are attributed to
+    # main rather than the feature branches), then by author. The keys are
+    # precomputed into plain tuples and sorted directly — no per-element
+    # lambda call — with the index as tiebreaker keeping the sort stable.
     # TODO: hardcoded 'main' branch name for now, actually we need a way to find out which branch is the earliest
     # branch in the list, and we order the branches by the created date
-    main_branch = 'main'
-    for commit in commits:
-        if commit['branch'] == main_branch:
-            commits.remove(commit)
-            commits.insert(0, commit)
-            break
+    decorated = sorted((commit['branch'] != 'main', commit['author'], idx)
+                       for idx, commit in enumerate(commits))
+    commits = [commits[idx] for _, _, idx in decorated]
 
+    # set membership makes the dedup one hash probe per commit instead of a
+    # scan over every sha seen so far
+    seen = set()
     for commit_object in commits:
-        messages = commit_object['commit_messages']
-        for message in messages:
-            sha = message['sha']
-            if sha not in unique_commits:
-                unique_commits.append(sha)
-            else:
-                message['removed'] = True
-
-        messages = [message for message in messages if not message.get('removed')]
-        commit_object['commit_messages'] = messages
+        kept = []
+        for message in commit_object['commit_messages']:
+            if message['sha'] not in seen:
+                seen.add(message['sha'])
+                kept.append(message)
+        commit_object['commit_messages'] = kept
 
     # remove commit objects with no commit messages
     commits = [commit_object for commit_object in commits if commit_object['commit_messages']]
@@ -208,36 +369,33 @@ def get_base_branch_map(repo_path, start_date, end_date, access_token, author=No
 
     # Fetch the list of branches in the repository
     branches_url = f'{base_url}/branches'
-    branches_response = requests.get(branches_url, headers=headers)
-    branches = [branch['name'] for branch in branches_response.json()]
+    branches = [branch['name'] for branch in fetch_all_pages(branches_url, headers)]
 
-    base_branch_map = {}
-    branch_commits_caches = {}
+    # fetch each branch's commits exactly once and hash the shas up front;
+    # the pairwise comparison below then runs purely in memory instead of
+    # re-requesting branches inside the double loop. The fetches fan out over
+    # the pooled session, so the phase costs one slow round trip, not B
+    def branch_commits_of(branch_name):
+        return fetch_all_pages(f'{base_url}/commits', headers, {**commit_params, "sha": branch_name})
+
+    with ThreadPoolExecutor(max_workers=min(len(branches) or 1, 16)) as executor:
+        branch_commits_caches = dict(zip(branches, executor.map(branch_commits_of, branches)))
+    branch_sha_sets = {branch: {commit['sha'] for commit in branch_commits}
+                       for branch, branch_commits in branch_commits_caches.items()}
 
+    base_branch_map = {}
     for branch in branches:
-        # Fetch the list of commits for the current branch
-        branch_url = f'{base_url}/commits?sha={branch}'
-        branch_response = requests.get(branch_url, headers=headers, params=commit_params)
-        branch_commits = branch_response.json()
-        branch_commit_hashes = [commit['sha'] for commit in branch_commits]
-        branch_commits_caches[branch] = branch_commits
-
-        # Find the base branch for the current branch
+        branch_shas = branch_sha_sets[branch]
+
+        # the base branch is the one sharing the most commits with this branch
         base_branch = None
-        base_branch_commits = []
+        best_overlap = 0
         for other_branch in branches:
             if other_branch != branch:
-                other_branch_url = f'{base_url}/commits?sha={other_branch}'
-                if other_branch in branch_commits_caches:
-                    other_branch_commits = branch_commits_caches[other_branch]
-                else:
-                    other_branch_response = requests.get(other_branch_url, headers=headers, params=commit_params)
-                    other_branch_commits = other_branch_response.json()
-                other_branch_commit_hashes = [commit['sha'] for commit in other_branch_commits]
-                common_commits = set(branch_commit_hashes) & set(other_branch_commit_hashes)
-                if len(common_commits) > len(base_branch_commits):
+                overlap = len(branch_shas & branch_sha_sets[other_branch])
+                if overlap > best_overlap:
+                    best_overlap = overlap
                     base_branch = other_branch
-                    base_branch_commits = other_branch_commits
 
         base_branch_map[branch] = base_branch
 
@@ -277,36 +435,174 @@ def get_all_unique_commits(repo_path, base_branch_map, commits_caches, start_dat
 
     unique_commits_map = {}
 
+    # fetch every branch the cache is missing in one parallel sweep, so the
+    # loop below never blocks on a round trip of its own
+    needed = sorted({name for branch, base_branch in base_branch_map.items()
+                     for name in (branch, base_branch)
+                     if name and name not in commits_caches})
+    if needed:
+        def branch_commits_of(branch_name):
+            return fetch_all_pages(f'{base_url}/commits', headers, {**commit_params, "sha": branch_name})
+
+        with ThreadPoolExecutor(max_workers=min(len(needed), 16)) as executor:
+            commits_caches = {**commits_caches,
+                              **dict(zip(needed, executor.map(branch_commits_of, needed)))}
+
     for branch, base_branch in base_branch_map.items():
-        # Fetch the list of commits for the current branch
-        if branch in commits_caches:
-            branch_commits = commits_caches[branch]
-        else:
-            query_url = f'{base_url}/commits?sha={branch}'
-            branch_response = requests.get(query_url, headers=headers, params=commit_params)
-            branch_commits = branch_response.json()
+        branch_commits = commits_caches[branch]
 
         if not base_branch:
             unique_commits_map[branch] = branch_commits
             continue
 
-        # Fetch the list of commits for the base branch
-        if base_branch in commits_caches:
-            base_branch_commits = commits_caches[base_branch]
-        else:
-            query_url = f'{base_url}/commits?sha={base_branch}'
-            base_branch_response = requests.get(query_url, headers=headers, params=commit_params)
-            base_branch_commits = base_branch_response.json()
+        base_branch_commits = commits_caches[base_branch]
 
-        # Find the unique commits on the current branch
-        unique_commits = [commit for commit in branch_commits if commit not in base_branch_commits]
+        # Find the unique commits on the current branch; comparing by sha
+        # against a set is one hash probe per commit, where comparing whole
+        # commit dicts against the base list was a full scan each
+        base_branch_shas = {commit['sha'] for commit in base_branch_commits}
+        unique_commits = [commit for commit in branch_commits
+                          if commit['sha'] not in base_branch_shas]
 
         unique_commits_map[branch] = unique_commits
 
     return unique_commits_map
 
 
-def get_all_commits(repo_path, start_date, end_date, access_token, author=None):
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# One POST returns every branch with its history for the window, replacing
+# the /branches call plus one /commits call per branch.
+ALL_COMMITS_QUERY = """
+query($owner: String!, $name: String!, $since: GitTimestamp!, $until: GitTimestamp!) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/heads/", first: 100) {
+      nodes {
+        name
+        target {
+          ... on Commit {
+            history(since: $since, until: $until, first: 100) {
+              pageInfo { hasNextPage endCursor }
+              nodes {
+                oid
+                message
+                author { name email date }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Follow-up query for branches whose history spans more than one page.
+BRANCH_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $branch: String!, $since: GitTimestamp!, $until: GitTimestamp!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    ref(qualifiedName: $branch) {
+      target {
+        ... on Commit {
+          history(since: $since, until: $until, first: 100, after: $cursor) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              oid
+              message
+              author { name email date }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _graphql_commit(commit):
+    """
+    Converts a GraphQL history node into the REST commit shape.
+
+    Args:
+        commit (dict): A commit node from a GraphQL history connection.
+
+    Returns:
+        dict: The commit in the shape the REST endpoints return.
+    """
+    return {
+        "sha": commit["oid"],
+        "commit": {
+            "message": commit["message"],
+            "author": commit["author"],
+        },
+    }
+
+
+def get_all_commits_graphql(repo_path, start_date, end_date, access_token):
+    """
+    Get the commits for each branch of a GitHub repository with one GraphQL
+    query instead of one REST round trip per branch.
+
+    Args:
+        repo_path: owner/repo format
+        start_date: The start date of the date range.
+        end_date: The end date of the date range.
+        access_token: GitHub access token
+
+    Returns:
+        dict: A dictionary mapping each branch to its commits in the same
+            shape the REST endpoints return, or None when the query fails and
+            the caller should fall back to REST.
+    """
+    owner, name = repo_path.split("/", 1)
+    variables = {
+        "owner": owner,
+        "name": name,
+        "since": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "until": end_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+    session = get_github_session()
+    try:
+        response = session.post(GITHUB_GRAPHQL_URL,
+                                json={"query": ALL_COMMITS_QUERY, "variables": variables},
+                                headers={"Authorization": f"Bearer {access_token}"})
+        payload = response.json()
+        if response.status_code != 200 or payload.get("errors"):
+            logger.warning("GitHub GraphQL query failed, falling back to REST: %s",
+                           payload.get("errors", response.status_code))
+            return None
+
+        commits_map = {}
+        for node in payload["data"]["repository"]["refs"]["nodes"]:
+            history = ((node.get("target") or {}).get("history") or {})
+            commits_map[node["name"]] = [_graphql_commit(commit)
+                                         for commit in history.get("nodes", [])]
+            # branches with more than one page of history are paged through
+            # with cursor follow-up queries; most branches never hit this
+            page_info = history.get("pageInfo") or {}
+            while page_info.get("hasNextPage"):
+                page_variables = dict(variables, branch=f"refs/heads/{node['name']}",
+                                      cursor=page_info["endCursor"])
+                response = session.post(GITHUB_GRAPHQL_URL,
+                                        json={"query": BRANCH_HISTORY_QUERY, "variables": page_variables},
+                                        headers={"Authorization": f"Bearer {access_token}"})
+                payload = response.json()
+                if response.status_code != 200 or payload.get("errors"):
+                    logger.warning("GitHub GraphQL pagination failed, falling back to REST: %s",
+                                   payload.get("errors", response.status_code))
+                    return None
+                history = payload["data"]["repository"]["ref"]["target"]["history"]
+                commits_map[node["name"]].extend(_graphql_commit(commit)
+                                                for commit in history.get("nodes", []))
+                page_info = history.get("pageInfo") or {}
+        return commits_map
+    except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+        logger.warning("GitHub GraphQL query failed, falling back to REST: %s", str(e))
+        return None
+
+
+def get_all_commits(repo_path, start_date, end_date, access_token, author=None, branch=None):
     """
     Get the commits for each branch in a GitHub repository.
     Args:
@@ -315,6 +611,8 @@ def get_all_commits(repo_path, start_date, end_date, access_token, author=None):
         end_date: The end date of the date range.
         access_token: GitHub access token
         author: The author name or email.
+        branch: When given, only this branch is fetched and the branch
+            enumeration round trip is skipped.
 
     Returns:
         dict: A dictionary mapping each branch to its commits.
@@ -335,20 +633,23 @@ def get_all_commits(repo_path, start_date, end_date, access_token, author=None):
     if author:
         commit_params["author"] = author
 
-    # Get the list of branches in the repository
-    branches_url = f'{base_url}/branches'
-    branches_response = requests.get(branches_url, headers=headers)
-    branches = [branch['name'] for branch in branches_response.json()]
-
-    commits_map = {}
-
-    for branch in branches:
-        # Fetch the list of commits for the current branch
-        query_url = f'{base_url}/commits?sha={branch}'
-        branch_response = requests.get(query_url, headers=headers, params=commit_params)
-        branch_commits = branch_response.json()
-
-        commits_map[branch] = branch_commits
+    if branch:
+        branches = [branch]
+    else:
+        # Get the list of branches in the repository
+        branches_url = f'{base_url}/branches'
+        branches = [branch['name'] for branch in fetch_all_pages(branches_url, headers)]
+
+    def branch_commits(branch_name):
+        return fetch_all_pages(f'{base_url}/commits', headers, {**commit_params, "sha": branch_name})
+
+    if len(branches) > 1:
+        # each branch fetch blocks on network RTT; fan them out over the
+        # pooled session so total latency approaches the slowest branch
+        with ThreadPoolExecutor(max_workers=min(len(branches), 8)) as executor:
+            commits_map = dict(zip(branches, executor.map(branch_commits, branches)))
+    else:
+        commits_map = {branch: branch_commits(branch) for branch in branches}
 
     return commits_map
 
@@ -367,30 +668,33 @@ def get_base_branch_map_local(repo, start_date, end_date, author=None):
     """
     base_branch_map = {}
 
-    remote_branches = repo.git.branch('-r').split('\n')
+    remote_branches = [branch.strip() for branch in repo.git.branch('-r').split('\n')]
+    remote_branches = [branch for branch in remote_branches if
+                       branch.startswith('origin/') and not branch.startswith('origin/HEAD')]
+
+    # walk each branch exactly once instead of spawning a git subprocess per
+    # (branch, other_branch) pair; git prunes the walk by date natively. The
+    # sha sets are built once per branch so the pairwise comparison is a set
+    # intersection, not a fresh set() construction per pair
+    branch_sha_map = {}
     for branch in remote_branches:
-        branch = branch.strip()
-        if branch.startswith('origin/') and not branch.startswith('origin/HEAD'):
-            branch_commits = list(repo.iter_commits(branch, author=author))
-            branch_commits = [commit for commit in branch_commits if
-                              start_date <= commit.committed_datetime.replace(tzinfo=None) <= end_date]
-
-            base_branch = None
-            base_branch_commits = []
-            for other_branch in remote_branches:
-                other_branch = other_branch.strip()
-                if other_branch.startswith('origin/') and not other_branch.startswith('origin/HEAD'):
-                    if other_branch != branch:
-                        other_branch_commits = list(repo.iter_commits(other_branch, author=author))
-                        other_branch_commits = [commit for commit in other_branch_commits if
-                                                start_date <= commit.committed_datetime.replace(
-                                                    tzinfo=None) <= end_date]
-                        common_commits = set(branch_commits) & set(other_branch_commits)
-                        if len(common_commits) > len(base_branch_commits):
-                            base_branch = other_branch
-                            base_branch_commits = other_branch_commits
-
-            base_branch_map[branch] = base_branch
+        branch_sha_map[branch] = {commit.hexsha
+                                  for commit in repo.iter_commits(branch, author=author,
+                                                                  since=start_date.isoformat(),
+                                                                  until=end_date.isoformat())}
+
+    for branch, branch_shas in branch_sha_map.items():
+        # the base branch is the one sharing the most commits with this branch
+        base_branch = None
+        best_overlap = 0
+        for other_branch, other_branch_shas in branch_sha_map.items():
+            if other_branch != branch:
+                overlap = len(branch_shas & other_branch_shas)
+                if overlap > best_overlap:
+                    best_overlap = overlap
+                    base_branch = other_branch
+
+        base_branch_map[branch] = base_branch
 
     return base_branch_map
 
@@ -413,28 +717,64 @@ def get_all_unique_commits_local(repo, base_branch_map, start_date, end_date, au
     # Fetch remote branches
     repo.remotes.origin.fetch()
 
+    # walk each ref at most once, even when it is the base of several branches
+    commits_cache = {}
+
+    def ref_commits(ref):
+        if ref.name not in commits_cache:
+            # git prunes the walk by date natively; keep the sha set alongside
+            # the list so membership tests are hash probes, not list scans
+            commits = list(repo.iter_commits(ref, author=author,
+                                             since=start_date.isoformat(),
+                                             until=end_date.isoformat()))
+            commits_cache[ref.name] = (commits, {commit.hexsha for commit in commits})
+        return commits_cache[ref.name]
+
+    # snapshot the remote refs once; every access to repo.remotes.origin.refs
+    # re-enumerates the ref database, and membership tests on it scan linearly
+    origin_refs = list(repo.remotes.origin.refs)
+    refs_by_name = {ref.name: ref for ref in origin_refs}
+    refs_by_short_name = {}
+    for ref in origin_refs:
+        refs_by_short_name.setdefault(ref.name.split('/')[-1], ref)
+
+    def branch_refs(branch, base_branch):
+        branch_ref = refs_by_short_name.get(branch)
+        base_ref = refs_by_name.get(base_branch) if base_branch else None
+        return branch_ref, base_ref
+
+    # warm the per-ref cache with all needed walks fanned out over threads;
+    # each walk blocks on a git subprocess, so they overlap instead of queueing
+    needed_refs = {}
     for branch, base_branch in base_branch_map.items():
-        # ignore HEAD branch
         if branch == 'HEAD':
             continue
+        branch_ref, base_ref = branch_refs(branch, base_branch)
+        for ref in (branch_ref, base_ref):
+            if ref is not None:
+                needed_refs.setdefault(ref.name, ref)
+    if len(needed_refs) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(needed_refs), 8)) as executor:
+            # consume the iterator so any walk error surfaces here
+            list(executor.map(ref_commits, needed_refs.values()))
 
-        for branch_ref in repo.remotes.origin.refs:
-            if branch_ref.name.split('/')[-1] == branch:
-                branch_commits = list(repo.iter_commits(branch_ref, author=author))
-                branch_commits = [commit for commit in branch_commits if
-                                  start_date <= commit.committed_datetime.replace(tzinfo=None) <= end_date]
+    for branch, base_branch in base_branch_map.items():
+        # ignore HEAD branch
+        if branch == 'HEAD':
+            continue
 
-                if not base_branch or base_branch not in repo.remotes.origin.refs:
-                    unique_commits_map[branch] = branch_commits
-                    continue
+        branch_ref, base_ref = branch_refs(branch, base_branch)
+        if branch_ref is None:
+            continue
+        branch_commits, _ = ref_commits(branch_ref)
 
-                base_branch_ref = repo.remotes.origin.refs[base_branch]
-                base_branch_commits = list(repo.iter_commits(base_branch_ref, author=author))
-                base_branch_commits = [commit for commit in base_branch_commits if
-                                       start_date <= commit.committed_datetime.replace(tzinfo=None) <= end_date]
+        if base_ref is None:
+            unique_commits_map[branch] = branch_commits
+            continue
 
-                unique_commits = [commit for commit in branch_commits if commit not in base_branch_commits]
+        _, base_branch_shas = ref_commits(base_ref)
 
-                unique_commits_map[branch] = unique_commits
+        unique_commits_map[branch] = [commit for commit in branch_commits
+                                      if commit.hexsha not in base_branch_shas]
 
     return unique_commits_map